@@ -1,24 +1,102 @@
 """CLI interface for FlaskTrack."""
 
+import sys
+from functools import lru_cache
 from pathlib import Path
 
 import typer
-from cookiecutter.main import cookiecutter
 from rich import print
-from rich.console import Console
-from rich.table import Table
 
 from flasktrack import __version__
-from flasktrack.scaffold import Scaffold
-from flasktrack.tracker import FlaskTracker
 from flasktrack.utils import add_user_to_app
 
+_TEMPLATE_DIR = (Path(__file__).parent / "templates" / "flask-app").resolve()
+
+# Help and usage blocks, each emitted with a single console.print
+_ROUTES_USAGE = """\
+[bold red]Error:[/bold red] Missing argument 'APP_PATH'.
+
+[bold cyan]Usage:[/bold cyan] flasktrack routes [APP_PATH]
+
+List all routes in a Flask application.
+
+[bold cyan]Arguments:[/bold cyan]
+  APP_PATH  Path to the Flask application file or module
+
+[bold cyan]Options:[/bold cyan]
+  --help    Show this message and exit."""
+
+_INIT_USAGE = """\
+[bold red]Error:[/bold red] Missing argument 'PROJECT_NAME'.
+
+[bold cyan]Usage:[/bold cyan] flasktrack init [PROJECT_NAME]
+
+Initialize a new Flask application with authentication and best practices.
+
+[bold cyan]Arguments:[/bold cyan]
+  PROJECT_NAME  Name of the Flask project to create, or '.' to use current directory name
+
+[bold cyan]Options:[/bold cyan]
+  -d, --dir PATH  Directory to create the project in (defaults to current directory)
+  --help          Show this message and exit.
+
+[bold cyan]Examples:[/bold cyan]
+  flasktrack init "My New App"
+  flasktrack init .  # Use current directory name"""
+
+_INIT_DONE = """\
+[bold green]✓[/bold green] Project created at: {project_path}
+
+[bold cyan]Next steps:[/bold cyan]
+  1. cd {cd_path}
+  2. just install  # Sets up everything for development
+  3. just run      # Start the development server
+
+[bold green]Your Flask app is ready![/bold green] 🎉"""
+
+_MAIN_HELP = f"""\
+FlaskTrack - A Rails-inspired Flask framework with scaffolding
+Version: {__version__}
+
+Usage: flasktrack [COMMAND]
+
+Commands:
+  init      Initialize a new Flask application
+  scaffold  Generate model, controller, forms, and views
+  add-admin Add an admin user to a Flask application
+  routes    List all routes in a Flask application
+  version   Show version information
+
+Examples:
+  flasktrack init "My New App"
+  flasktrack init .  # Uses current directory name
+  flasktrack scaffold Post title:string content:text
+  flasktrack add-admin john john@example.com
+  flasktrack add-admin jane jane@example.com --password secret123
+  flasktrack routes app.py
+
+Run 'flasktrack [COMMAND] --help' for more information on a command."""
+
 app = typer.Typer(
     name="flasktrack",
     help="Track and analyze Flask applications",
     add_completion=False,
 )
-console = Console()
+
+
+@lru_cache(maxsize=1)
+def _get_console():
+    """Create the shared Rich console on first use.
+
+    When output is piped or captured, skip colour and the highlighter
+    regexes; markup is still parsed so the "[bold]...[/bold]" tags are
+    stripped.
+    """
+    from rich.console import Console
+
+    if sys.stdout.isatty():
+        return Console()
+    return Console(no_color=True, highlight=False, emoji=False)
 
 
 @app.command()
@@ -27,38 +105,57 @@ def routes(
         None,
         help="Path to the Flask application file or module",
     ),
+    plain: bool = typer.Option(
+        False,
+        "--plain",
+        help="Print tab-separated rows without Rich formatting",
+    ),
 ):
     """List all routes in a Flask application."""
+    # Imported here so other commands don't pay for importing Flask
+    from flasktrack.tracker import FlaskTracker
+
+    console = _get_console()
     if app_path is None:
-        console.print("[bold red]Error:[/bold red] Missing argument 'APP_PATH'.")
-        console.print("\n[bold cyan]Usage:[/bold cyan] flasktrack routes [APP_PATH]")
-        console.print("\nList all routes in a Flask application.")
-        console.print("\n[bold cyan]Arguments:[/bold cyan]")
-        console.print("  APP_PATH  Path to the Flask application file or module")
-        console.print("\n[bold cyan]Options:[/bold cyan]")
-        console.print("  --help    Show this message and exit.")
+        console.print(_ROUTES_USAGE)
         raise typer.Exit(1)
 
     if not app_path.exists():
         console.print(f"[bold red]Error:[/bold red] Path '{app_path}' does not exist.")
         raise typer.Exit(1)
 
-    console.print("[bold cyan]Flask Routes[/bold cyan] 📍")
-
     tracker = FlaskTracker(app_path, verbose=False)
     routes_list = tracker.get_routes()
 
+    if plain:
+        _write_plain_routes(routes_list)
+        return
+
+    from rich.table import Table
+
+    console.print("[bold cyan]Flask Routes[/bold cyan] 📍")
+
     table = Table(title="Application Routes")
     table.add_column("Endpoint", style="cyan")
     table.add_column("Methods", style="yellow")
     table.add_column("Rule", style="green")
-
-    for route in routes_list:
-        table.add_row(route["endpoint"], ", ".join(route["methods"]), route["rule"])
+    for r in routes_list:
+        table.add_row(r["endpoint"], ", ".join(r["methods"]), r["rule"])
 
     console.print(table)
 
 
+def _write_plain_routes(routes_list):
+    """Write routes as tab-separated rows, bypassing Rich's table layout."""
+    sys.stdout.write(
+        "ENDPOINT\tMETHODS\tRULE\n"
+        + "".join(
+            f"{r['endpoint']}\t{','.join(r['methods'])}\t{r['rule']}\n"
+            for r in routes_list
+        )
+    )
+
+
 @app.command()
 def init(
     project_name: str | None = typer.Argument(
@@ -73,24 +170,12 @@ def init(
     ),
 ):
     """Initialize a new Flask application with authentication and best practices."""
+    # Imported here so other commands don't pay for importing cookiecutter
+    from cookiecutter.main import cookiecutter
+
+    console = _get_console()
     if project_name is None:
-        console.print("[bold red]Error:[/bold red] Missing argument 'PROJECT_NAME'.")
-        console.print("\n[bold cyan]Usage:[/bold cyan] flasktrack init [PROJECT_NAME]")
-        console.print(
-            "\nInitialize a new Flask application with authentication and best practices."
-        )
-        console.print("\n[bold cyan]Arguments:[/bold cyan]")
-        console.print(
-            "  PROJECT_NAME  Name of the Flask project to create, or '.' to use current directory name"
-        )
-        console.print("\n[bold cyan]Options:[/bold cyan]")
-        console.print(
-            "  -d, --dir PATH  Directory to create the project in (defaults to current directory)"
-        )
-        console.print("  --help          Show this message and exit.")
-        console.print("\n[bold cyan]Examples:[/bold cyan]")
-        console.print('  flasktrack init "My New App"')
-        console.print("  flasktrack init .  # Use current directory name")
+        console.print(_INIT_USAGE)
         raise typer.Exit(1)
 
     # Handle special case where user passes '.' to use current directory name
@@ -104,8 +189,7 @@ def init(
         f"[bold green]Creating Flask application:[/bold green] {project_name} 🚀"
     )
 
-    # Get the template directory
-    template_dir = Path(__file__).parent / "templates" / "flask-app"
+    template_dir = _TEMPLATE_DIR
 
     if not template_dir.exists():
         console.print(
@@ -132,17 +216,16 @@ def init(
         }
 
     try:
-        # Run cookiecutter
+        # Run cookiecutter. The template ships with the package, so skip
+        # locating and parsing the user's cookiecutter config on every init.
         project_path = cookiecutter(
             str(template_dir),
             output_dir=str(output_dir),
             no_input=True,
             extra_context=extra_context,
+            default_config=True,
         )
 
-        console.print(f"[bold green]✓[/bold green] Project created at: {project_path}")
-        console.print("\n[bold cyan]Next steps:[/bold cyan]")
-
         # Get the relative path if possible, otherwise use absolute
         try:
             cd_path = Path(project_path).relative_to(Path.cwd())
@@ -150,10 +233,7 @@ def init(
             # Project is not in a subdirectory of cwd, use absolute path
             cd_path = Path(project_path)
 
-        console.print(f"  1. cd {cd_path}")
-        console.print("  2. just install  # Sets up everything for development")
-        console.print("  3. just run      # Start the development server")
-        console.print("\n[bold green]Your Flask app is ready![/bold green] 🎉")
+        console.print(_INIT_DONE.format(project_path=project_path, cd_path=cd_path))
 
     except Exception as e:
         console.print(f"[bold red]Error creating project:[/bold red] {str(e)}")
@@ -178,6 +258,7 @@ def add_admin(
     ),
 ):
     """Add a new admin user to a Flask application created with 'ft init'."""
+    console = _get_console()
     console.print(f"[bold cyan]Adding admin user:[/bold cyan] {username}")
 
     # Check if the app_path contains a Flask app
@@ -243,6 +324,12 @@ def scaffold(
     skip_init: bool = typer.Option(
         False, "--skip-init", help="Skip updating app/__init__.py"
     ),
+    app_path: Path | None = typer.Option(
+        None,
+        "--app-path",
+        "-a",
+        help="Path to the Flask application directory (defaults to current directory)",
+    ),
 ):
     """Generate a scaffold with model, controller, forms, and views.
 
@@ -250,15 +337,20 @@ def scaffold(
         flasktrack scaffold Post title:string content:text
         flasktrack scaffold Comment body:text post:references user:references
         flasktrack scaffold Product name:string price:float available:boolean
+        flasktrack scaffold Post title:string --app-path path/to/project
     """
+    # Imported here so other commands don't pay for importing Jinja2
+    from flasktrack.scaffold import Scaffold
+
+    console = _get_console()
     console.print(f"[bold cyan]Creating scaffold for {model_name}...[/bold cyan]")
 
     try:
         # Create scaffold generator
         scaffold_gen = Scaffold(model_name, fields)
 
-        # Get the current directory as the base path
-        base_path = Path.cwd()
+        # Default to the current directory as the base path
+        base_path = app_path or Path.cwd()
 
         # Check if we're in a Flask app directory
         app_dir = base_path / "app"
@@ -288,23 +380,19 @@ def scaffold(
                     "Please manually register the blueprint."
                 )
 
-        # Show next steps
-        console.print("\n[bold cyan]Next steps:[/bold cyan]")
-        console.print("1. Review the generated files")
-
-        # Check for references and show TODO notes
-        has_references = any(f["is_reference"] for f in scaffold_gen.fields)
-        if has_references:
-            console.print(
-                "2. Add relationships to referenced models (see TODOs in model file)"
+        # Show next steps, with a TODO note when there are references
+        steps = ["Review the generated files"]
+        if any(f.is_reference for f in scaffold_gen.fields):
+            steps.append(
+                "Add relationships to referenced models (see TODOs in model file)"
             )
-            console.print("3. Run database migrations")
-            console.print(f"4. Start server and visit /{scaffold_gen.name_plural}")
-        else:
-            console.print("2. Run database migrations")
-            console.print(f"3. Start server and visit /{scaffold_gen.name_plural}")
-
-        console.print("\n[bold green]Scaffold created successfully![/bold green] 🎉")
+        steps.append("Run database migrations")
+        steps.append(f"Start server and visit /{scaffold_gen.name_plural}")
+        console.print(
+            "\n[bold cyan]Next steps:[/bold cyan]\n"
+            + "\n".join(f"{i}. {step}" for i, step in enumerate(steps, 1))
+            + "\n\n[bold green]Scaffold created successfully![/bold green] 🎉"
+        )
 
     except ValueError as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
@@ -342,25 +430,7 @@ def main(
         raise typer.Exit()
 
     if ctx.invoked_subcommand is None:
-        console.print("FlaskTrack - A Rails-inspired Flask framework with scaffolding")
-        console.print(f"Version: {__version__}\n")
-        console.print("Usage: flasktrack [COMMAND]")
-        console.print("\nCommands:")
-        console.print("  init      Initialize a new Flask application")
-        console.print("  scaffold  Generate model, controller, forms, and views")
-        console.print("  add-admin Add an admin user to a Flask application")
-        console.print("  routes    List all routes in a Flask application")
-        console.print("  version   Show version information")
-        console.print("\nExamples:")
-        console.print('  flasktrack init "My New App"')
-        console.print("  flasktrack init .  # Uses current directory name")
-        console.print("  flasktrack scaffold Post title:string content:text")
-        console.print("  flasktrack add-admin john john@example.com")
-        console.print("  flasktrack add-admin jane jane@example.com --password secret123")
-        console.print("  flasktrack routes app.py")
-        console.print(
-            "\nRun 'flasktrack [COMMAND] --help' for more information on a command."
-        )
+        _get_console().print(_MAIN_HELP)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,112 @@
 """Scaffold generator for FlaskTrack."""
 
+import ast
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Any
-
-from jinja2 import Environment, FileSystemLoader
+from typing import NamedTuple
+
+from jinja2 import Environment, FileSystemLoader, Template
+
+# Field types that map straight to a column, with no reference handling
+_SIMPLE_TYPES = frozenset(
+    {"string", "text", "integer", "float", "decimal", "boolean", "date", "datetime"}
+)
+
+# Patterns used to parse field types and to edit app/__init__.py
+_REF_RE = re.compile(r"(references|belongs_to)(?:\[(\w+)\])?")
+_IMPORT_RE = re.compile(
+    r"(\s+# Register blueprints\n)(.*?)(from app\.controllers\.\w+ import \w+_bp\n)"
+)
+_REGISTER_RE = re.compile(r"(\s+)(app\.register_blueprint\()")
+_REGISTER_ANY_RE = re.compile(r"(app\.register_blueprint\([^)]+\))")
+_SHELL_CTX_RE = re.compile(
+    r"(@app\.shell_context_processor\s+def make_shell_context\(\):.*?)(from app\.models\.\w+ import \w+\n)",
+    re.DOTALL,
+)
+_RETURN_RE = re.compile(r'(return \{[^}]+)"User": User')
+
+_SCAFFOLD_DIR = (Path(__file__).parent / "templates" / "scaffold").resolve()
+
+
+# Common irregular plurals
+_IRREGULAR_PLURALS = {
+    "person": "people",
+    "child": "children",
+    "man": "men",
+    "woman": "women",
+    "tooth": "teeth",
+    "foot": "feet",
+    "mouse": "mice",
+    "goose": "geese",
+}
+
+# Word ending -> (characters to strip, plural ending); two-letter endings win
+_SUFFIX_PLURALS = {
+    "sh": (0, "es"),
+    "ch": (0, "es"),
+    "fe": (2, "ves"),
+    "s": (0, "es"),
+    "x": (0, "es"),
+    "z": (0, "es"),
+    "o": (0, "es"),
+    "f": (1, "ves"),
+}
+
+
+def pluralize(word: str) -> str:
+    """Simple pluralization of model names.
+
+    Args:
+        word: Singular word to pluralize
+
+    Returns:
+        Pluralized word
+    """
+    if word in _IRREGULAR_PLURALS:
+        return _IRREGULAR_PLURALS[word]
+
+    if word.endswith("y") and len(word) > 1 and word[-2] not in "aeiou":
+        return word[:-1] + "ies"
+
+    for ending in (word[-2:], word[-1:]):
+        rule = _SUFFIX_PLURALS.get(ending)
+        if rule:
+            strip, suffix = rule
+            return word[: len(word) - strip] + suffix
+
+    return word + "s"
+
+
+class Field(NamedTuple):
+    """A parsed 'name:type' field definition."""
+
+    name: str
+    type: str
+    sqlalchemy_type: str
+    form_field_type: str
+    is_reference: bool
+    referenced_model: str | None
+
+
+@lru_cache(maxsize=1)
+def _get_env() -> Environment:
+    """Return the shared Jinja2 environment for the scaffold templates."""
+    return Environment(
+        loader=FileSystemLoader(str(_SCAFFOLD_DIR)),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+        cache_size=400,
+    )
+
+
+@cache
+def _get_template(name: str) -> Template:
+    """Return a compiled scaffold template by file name."""
+    return _get_env().get_template(name)
 
 
 class Scaffold:
@@ -53,6 +155,9 @@ class Scaffold:
         "belongs_to": "SelectField",
     }
 
+    # Kept as Scaffold.pluralize for existing callers
+    pluralize = staticmethod(pluralize)
+
     def __init__(self, name: str, fields: list[str]):
         """Initialize scaffold generator.
 
@@ -65,112 +170,79 @@ class Scaffold:
         self.name_plural = self.pluralize(self.name_lower)
         self.fields = self.parse_fields(fields)
 
-        # Set up Jinja2 environment
-        template_dir = Path(__file__).parent / "templates" / "scaffold"
-        self.env = Environment(
-            loader=FileSystemLoader(str(template_dir)),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-
-    def parse_fields(self, field_definitions: list[str]) -> list[dict[str, Any]]:
+    def parse_fields(self, field_definitions: list[str]) -> list[Field]:
         """Parse field definitions into structured format.
 
         Args:
             field_definitions: List of 'name:type' strings
 
         Returns:
-            List of field dictionaries with name, type, and metadata
+            List of Field records with name, type, and metadata
         """
-        fields = []
-        for field_def in field_definitions:
-            if ":" not in field_def:
-                raise ValueError(
-                    f"Invalid field definition: {field_def}. Use format 'name:type'"
-                )
-
-            name, field_type = field_def.split(":", 1)
-
-            # Check for custom model in references (e.g., author:references[User])
-            referenced_model = None
-            if field_type.startswith(("references", "belongs_to")):
-                match = re.match(r"(references|belongs_to)(?:\[(\w+)\])?", field_type)
-                if match:
-                    field_type = match.group(1)
-                    referenced_model = match.group(2)
-                    if not referenced_model:
-                        # Infer model from field name (e.g., 'user' -> 'User')
-                        referenced_model = name.capitalize()
-
-            # Check for prohibited database-specific types
-            if field_type in self.PROHIBITED_TYPES:
-                raise ValueError(
-                    f"Database-specific type '{field_type}' is not allowed. "
-                    f"FlaskTrack models must be compatible with both SQLite and PostgreSQL. "
-                    f"Use portable alternatives: json→text, uuid→string, array→related table"
-                )
-
-            if field_type not in self.TYPE_MAPPINGS:
-                raise ValueError(
-                    f"Invalid field type: {field_type}. "
-                    f"Valid types: {', '.join(self.TYPE_MAPPINGS.keys())}"
-                )
-
-            field_info = {
-                "name": name,
-                "type": field_type,
-                "sqlalchemy_type": self.TYPE_MAPPINGS[field_type],
-                "form_field_type": self.FORM_FIELD_MAPPINGS[field_type],
-                "is_reference": field_type in ("references", "belongs_to"),
-                "referenced_model": referenced_model,
-            }
-
-            fields.append(field_info)
+        return [self._parse_field(field_def) for field_def in field_definitions]
+
+    @classmethod
+    @lru_cache(maxsize=128)
+    def _parse_field(cls, field_def: str) -> Field:
+        """Parse a single 'name:type' definition, cached per definition string."""
+        if ":" not in field_def:
+            raise ValueError(
+                f"Invalid field definition: {field_def}. Use format 'name:type'"
+            )
 
-        return fields
+        name, field_type = field_def.split(":", 1)
+
+        # Plain column types need no further parsing
+        if field_type in _SIMPLE_TYPES:
+            return Field(
+                name,
+                field_type,
+                cls.TYPE_MAPPINGS[field_type],
+                cls.FORM_FIELD_MAPPINGS[field_type],
+                False,
+                None,
+            )
 
-    def pluralize(self, word: str) -> str:
-        """Simple pluralization of model names.
+        referenced_model = None
+        if field_type in ("references", "belongs_to"):
+            # Infer model from field name (e.g., 'user' -> 'User')
+            referenced_model = name.capitalize()
+        elif "[" in field_type:
+            # Custom model in references (e.g., author:references[User])
+            match = _REF_RE.match(field_type)
+            if match:
+                field_type = match.group(1)
+                referenced_model = match.group(2) or name.capitalize()
+
+        # Check for prohibited database-specific types
+        if field_type in cls.PROHIBITED_TYPES:
+            raise ValueError(
+                f"Database-specific type '{field_type}' is not allowed. "
+                f"FlaskTrack models must be compatible with both SQLite and PostgreSQL. "
+                f"Use portable alternatives: json→text, uuid→string, array→related table"
+            )
 
-        Args:
-            word: Singular word to pluralize
+        if field_type not in cls.TYPE_MAPPINGS:
+            raise ValueError(
+                f"Invalid field type: {field_type}. "
+                f"Valid types: {', '.join(cls.TYPE_MAPPINGS.keys())}"
+            )
 
-        Returns:
-            Pluralized word
-        """
-        # Common irregular plurals
-        irregular = {
-            "person": "people",
-            "child": "children",
-            "man": "men",
-            "woman": "women",
-            "tooth": "teeth",
-            "foot": "feet",
-            "mouse": "mice",
-            "goose": "geese",
-        }
-
-        if word in irregular:
-            return irregular[word]
-
-        # Rules for regular plurals
-        if word.endswith("y") and len(word) > 1 and word[-2] not in "aeiou":
-            return word[:-1] + "ies"
-        elif word.endswith(("s", "ss", "sh", "ch", "x", "z", "o")):
-            return word + "es"
-        elif word.endswith("f"):
-            return word[:-1] + "ves"
-        elif word.endswith("fe"):
-            return word[:-2] + "ves"
-        else:
-            return word + "s"
+        return Field(
+            name,
+            field_type,
+            cls.TYPE_MAPPINGS[field_type],
+            cls.FORM_FIELD_MAPPINGS[field_type],
+            field_type in ("references", "belongs_to"),
+            referenced_model,
+        )
 
     def generate_model(self) -> str:
         """Generate model code."""
-        template = self.env.get_template("model.py.jinja2")
+        template = _get_template("model.py.jinja2")
 
         # Collect referenced models for TODO comments
-        referenced_models = [field for field in self.fields if field["is_reference"]]
+        referenced_models = [field for field in self.fields if field.is_reference]
 
         return template.render(
             model_name=self.name,
@@ -181,24 +253,24 @@ class Scaffold:
 
     def generate_controller(self) -> str:
         """Generate controller/blueprint code."""
-        template = self.env.get_template("controller.py.jinja2")
+        template = _get_template("controller.py.jinja2")
 
         return template.render(
             model_name=self.name,
             model_name_lower=self.name_lower,
             model_name_plural=self.name_plural,
             fields=self.fields,
-            has_references=any(f["is_reference"] for f in self.fields),
+            has_references=any(f.is_reference for f in self.fields),
         )
 
     def generate_form(self) -> str:
         """Generate form code."""
-        template = self.env.get_template("form.py.jinja2")
+        template = _get_template("form.py.jinja2")
 
         return template.render(
             model_name=self.name,
             fields=self.fields,
-            has_references=any(f["is_reference"] for f in self.fields),
+            has_references=any(f.is_reference for f in self.fields),
         )
 
     def generate_views(self) -> dict[str, str]:
@@ -219,7 +291,7 @@ class Scaffold:
         ]
 
         for template_name in template_names:
-            template = self.env.get_template(f"{template_name}.jinja2")
+            template = _get_template(f"{template_name}.jinja2")
             views[template_name] = template.render(
                 model_name=self.name,
                 model_name_lower=self.name_lower,
@@ -232,53 +304,65 @@ class Scaffold:
     def write_files(self, base_path: Path) -> list[Path]:
         """Write all scaffold files to disk.
 
+        Everything is rendered and encoded before the first write, so a
+        template error or an existing file leaves the app untouched.
+
         Args:
             base_path: Base directory of the Flask app
 
         Returns:
             List of created file paths
         """
-        created_files = []
-
-        # Ensure base directories exist
         app_dir = base_path / "app"
-        models_dir = app_dir / "models"
-        controllers_dir = app_dir / "controllers"
-        forms_dir = app_dir / "forms"
         views_dir = app_dir / "views" / self.name_plural
 
-        for directory in [models_dir, controllers_dir, forms_dir, views_dir]:
+        # (path, content, kind) for files that must not already exist
+        unique_files = [
+            (
+                app_dir / "models" / f"{self.name_lower}.py",
+                self.generate_model().encode(),
+                "Model",
+            ),
+            (
+                app_dir / "controllers" / f"{self.name_plural}.py",
+                self.generate_controller().encode(),
+                "Controller",
+            ),
+            (
+                app_dir / "forms" / f"{self.name_lower}.py",
+                self.generate_form().encode(),
+                "Form",
+            ),
+        ]
+        views = [
+            (views_dir / view_name, view_content.encode())
+            for view_name, view_content in self.generate_views().items()
+        ]
+        paths = [path for path, _, _ in unique_files] + [path for path, _ in views]
+
+        # Create each target directory once
+        for directory in dict.fromkeys(path.parent for path in paths):
             directory.mkdir(parents=True, exist_ok=True)
 
-        # Write model
-        model_path = models_dir / f"{self.name_lower}.py"
-        if model_path.exists():
-            raise FileExistsError(f"Model already exists: {model_path}")
-        model_path.write_text(self.generate_model())
-        created_files.append(model_path)
-
-        # Write controller
-        controller_path = controllers_dir / f"{self.name_plural}.py"
-        if controller_path.exists():
-            raise FileExistsError(f"Controller already exists: {controller_path}")
-        controller_path.write_text(self.generate_controller())
-        created_files.append(controller_path)
-
-        # Write form
-        form_path = forms_dir / f"{self.name_lower}.py"
-        if form_path.exists():
-            raise FileExistsError(f"Form already exists: {form_path}")
-        form_path.write_text(self.generate_form())
-        created_files.append(form_path)
-
-        # Write views
-        views = self.generate_views()
-        for view_name, view_content in views.items():
-            view_path = views_dir / view_name
-            view_path.write_text(view_content)
-            created_files.append(view_path)
-
-        return created_files
+        # Exclusive create doubles as the existence check; on a clash, remove
+        # whatever this call already wrote so the app is left untouched
+        created: list[Path] = []
+        for path, data, kind in unique_files:
+            try:
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
+                for written in created:
+                    written.unlink()
+                raise FileExistsError(f"{kind} already exists: {path}") from None
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            created.append(path)
+
+        # View writes are independent, so overlap them on a small pool
+        with ThreadPoolExecutor(max_workers=min(8, len(views))) as executor:
+            list(executor.map(lambda view: view[0].write_bytes(view[1]), views))
+
+        return paths
 
     def update_app_init(self, app_init_path: Path) -> bool:
         """Update app/__init__.py to register the new blueprint.
@@ -301,11 +385,164 @@ class Scaffold:
         if import_line in content:
             return False  # Already registered
 
+        register_line = f"app.register_blueprint({self.name_plural}_bp, url_prefix='/{self.name_plural}')"
+        model_import = f"from app.models.{self.name_lower} import {self.name}"
+
+        try:
+            tree = ast.parse(content)
+        except SyntaxError:
+            content = self._edit_app_init_regex(
+                content, import_line, register_line, model_import
+            )
+        else:
+            edits = self._app_init_edits(
+                content, tree, import_line, register_line, model_import
+            )
+            # Apply all insertions in a single pass over the original text
+            parts = []
+            prev = 0
+            for offset, text in sorted(edits, key=lambda edit: edit[0]):
+                parts.append(content[prev:offset])
+                parts.append(text)
+                prev = offset
+            parts.append(content[prev:])
+            content = "".join(parts)
+
+        app_init_path.write_text(content)
+        return True
+
+    def _app_init_edits(
+        self,
+        content: str,
+        tree: ast.Module,
+        import_line: str,
+        register_line: str,
+        model_import: str,
+    ) -> list[tuple[int, str]]:
+        """Work out the insertions for app/__init__.py from its syntax tree.
+
+        Args:
+            content: Source of app/__init__.py
+            tree: Parsed module for content
+            import_line: Blueprint import to add
+            register_line: Blueprint registration to add
+            model_import: Model import to add to the shell context
+
+        Returns:
+            List of (offset, text) insertions into content
+        """
+        lines = content.splitlines(keepends=True)
+        line_starts = [0]
+        for line in lines:
+            line_starts.append(line_starts[-1] + len(line))
+
+        def offset(lineno: int, col: int) -> int:
+            # ast columns are UTF-8 byte offsets
+            line = lines[lineno - 1].encode()
+            return line_starts[lineno - 1] + len(line[:col].decode())
+
+        blueprint_imports = []
+        register_calls = []
+        shell_context = None
+        for node in ast.walk(tree):
+            if (
+                isinstance(node, ast.ImportFrom)
+                and (node.module or "").startswith("app.controllers.")
+                and any(alias.name.endswith("_bp") for alias in node.names)
+            ):
+                blueprint_imports.append(node)
+            elif (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Attribute)
+                and node.func.attr == "register_blueprint"
+            ):
+                register_calls.append(node)
+            elif (
+                isinstance(node, ast.FunctionDef) and node.name == "make_shell_context"
+            ):
+                shell_context = node
+
+        def position(node: ast.AST) -> tuple[int, int]:
+            return node.lineno, node.col_offset
+
+        edits = []
+        if blueprint_imports:
+            # Add import after the last blueprint import
+            last = max(blueprint_imports, key=position)
+            edits.append(
+                (
+                    line_starts[last.end_lineno],
+                    f"{' ' * last.col_offset}{import_line}\n",
+                )
+            )
+        elif register_calls:
+            # If no blueprint imports found, add before the first registration
+            first = min(register_calls, key=position)
+            edits.append(
+                (
+                    line_starts[first.lineno - 1],
+                    f"{' ' * first.col_offset}{import_line}\n\n",
+                )
+            )
+
+        if register_calls and register_line not in content:
+            last = max(register_calls, key=position)
+            edits.append(
+                (
+                    offset(last.end_lineno, last.end_col_offset),
+                    f"\n{' ' * last.col_offset}{register_line}",
+                )
+            )
+
+        if shell_context is not None and model_import not in content:
+            model_imports = [
+                node
+                for node in ast.walk(shell_context)
+                if isinstance(node, ast.ImportFrom)
+                and (node.module or "").startswith("app.models.")
+            ]
+            if model_imports:
+                last = max(model_imports, key=position)
+                edits.append(
+                    (
+                        line_starts[last.end_lineno],
+                        f"{' ' * last.col_offset}{model_import}\n",
+                    )
+                )
+                # Add to the returned dictionary
+                for node in ast.walk(shell_context):
+                    if (
+                        isinstance(node, ast.Return)
+                        and isinstance(node.value, ast.Dict)
+                        and node.value.values
+                    ):
+                        value = node.value.values[-1]
+                        edits.append(
+                            (
+                                offset(value.end_lineno, value.end_col_offset),
+                                f', "{self.name}": {self.name}',
+                            )
+                        )
+                        break
+
+        return edits
+
+    def _edit_app_init_regex(
+        self, content: str, import_line: str, register_line: str, model_import: str
+    ) -> str:
+        """Regex fallback for an app/__init__.py that does not parse.
+
+        Args:
+            content: Source of app/__init__.py
+            import_line: Blueprint import to add
+            register_line: Blueprint registration to add
+            model_import: Model import to add to the shell context
+
+        Returns:
+            Updated source
+        """
         # Find the blueprint import section
-        import_pattern = re.compile(
-            r"(\s+# Register blueprints\n)(.*?)(from app\.controllers\.\w+ import \w+_bp\n)"
-        )
-        match = import_pattern.search(content)
+        match = _IMPORT_RE.search(content)
 
         if match:
             # Add import after the last blueprint import
@@ -317,8 +554,7 @@ class Scaffold:
             )
         else:
             # If no blueprint imports found, add before the app.register_blueprint calls
-            register_pattern = re.compile(r"(\s+)(app\.register_blueprint\()")
-            match = register_pattern.search(content)
+            match = _REGISTER_RE.search(content)
             if match:
                 indent = match.group(1)
                 insert_pos = match.start()
@@ -329,11 +565,9 @@ class Scaffold:
                 )
 
         # Add blueprint registration
-        register_line = f"app.register_blueprint({self.name_plural}_bp, url_prefix='/{self.name_plural}')"
         if register_line not in content:
             # Find the last register_blueprint call
-            register_pattern = re.compile(r"(app\.register_blueprint\([^)]+\))")
-            matches = list(register_pattern.finditer(content))
+            matches = list(_REGISTER_ANY_RE.finditer(content))
             if matches:
                 last_match = matches[-1]
                 insert_pos = last_match.end()
@@ -347,34 +581,26 @@ class Scaffold:
                 )
 
         # Update shell context processor to include the new model
-        shell_context_pattern = re.compile(
-            r"(@app\.shell_context_processor\s+def make_shell_context\(\):.*?)(from app\.models\.\w+ import \w+\n)",
-            re.DOTALL,
-        )
-        match = shell_context_pattern.search(content)
+        match = _SHELL_CTX_RE.search(content)
 
-        if match:
-            model_import = f"from app.models.{self.name_lower} import {self.name}"
-            if model_import not in content:
-                # Add model import
-                insert_pos = match.end()
-                indent = "        "  # Standard indent for imports in shell context
+        if match and model_import not in content:
+            # Add model import
+            insert_pos = match.end()
+            indent = "        "  # Standard indent for imports in shell context
+            content = (
+                content[:insert_pos]
+                + f"{indent}{model_import}\n"
+                + content[insert_pos:]
+            )
+
+            # Add to return dictionary
+            return_match = _RETURN_RE.search(content)
+            if return_match:
+                insert_pos = return_match.end()
                 content = (
                     content[:insert_pos]
-                    + f"{indent}{model_import}\n"
+                    + f', "{self.name}": {self.name}'
                     + content[insert_pos:]
                 )
 
-                # Add to return dictionary
-                return_pattern = re.compile(r'(return \{[^}]+)"User": User')
-                return_match = return_pattern.search(content)
-                if return_match:
-                    insert_pos = return_match.end()
-                    content = (
-                        content[:insert_pos]
-                        + f', "{self.name}": {self.name}'
-                        + content[insert_pos:]
-                    )
-
-        app_init_path.write_text(content)
-        return True
+        return content
@@ -2,11 +2,15 @@
 """Application entry point."""
 
 import os
+from pathlib import Path
 
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables from the .env next to this file, if there is one,
+# instead of letting python-dotenv search up the directory tree for it
+env_file = Path(__file__).with_name(".env")
+if env_file.is_file():
+    load_dotenv(env_file)
 
 from app import create_app, db
 from app.models.user import User
@@ -1,37 +1,91 @@
 """Flask application factory."""
 
 from flask import Flask
-from flask_bcrypt import Bcrypt
-from flask_cors import CORS
 from flask_login import LoginManager
 from flask_mail import Mail
-from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
-from flask_wtf.csrf import CSRFProtect
 
-from app.config import config
+from app.config import config_settings
 
+# Shared by models and controllers, so these are created at import time
 db = SQLAlchemy()
-migrate = Migrate()
 login_manager = LoginManager()
-bcrypt = Bcrypt()
-csrf = CSRFProtect()
 mail = Mail()
 
+_extensions = None
+
+
+def _get_extensions():
+    """Import and instantiate the extensions only used by ``create_app``.
+
+    Memoized so the imports are paid once, on the first call, rather than
+    whenever ``app`` is imported.
+    """
+    global _extensions
+    if _extensions is None:
+        from flask_bcrypt import Bcrypt
+        from flask_cors import CORS
+        from flask_wtf.csrf import CSRFProtect
+
+        _extensions = (Bcrypt(), CSRFProtect(), CORS)
+    return _extensions
+
+
+def _enable_sqlite_wal(app):
+    """Switch the app's SQLite connections to WAL with relaxed fsyncs.
+
+    Readers no longer block on a writer, and commits skip the full fsync
+    of the default rollback journal.
+    """
+    from sqlalchemy import event
+
+    with app.app_context():
+        engine = db.engine
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+
+def _in_db_command():
+    """Return True while a ``flask db ...`` command is loading the app."""
+    import click
+
+    ctx = click.get_current_context(silent=True)
+    while ctx is not None:
+        if ctx.info_name == "db":
+            return True
+        ctx = ctx.parent
+    return False
+
 
 def create_app(config_name="development"):
     """Create and configure the Flask application."""
     app = Flask(__name__, template_folder="views")
-    app.config.from_object(config[config_name])
+    app.config.update(config_settings[config_name])
+
+    bcrypt, csrf, cors = _get_extensions()
 
     # Initialize extensions
     db.init_app(app)
-    migrate.init_app(app, db)
+    if app.config["SQLITE_WAL"] and app.config["SQLALCHEMY_DATABASE_URI"].startswith(
+        "sqlite"
+    ):
+        _enable_sqlite_wal(app)
+    # Flask-Migrate pulls in Alembic, so only set it up for `flask db ...`
+    # or when MIGRATE_ENABLED asks for it
+    if app.config["MIGRATE_ENABLED"] or _in_db_command():
+        from flask_migrate import Migrate
+
+        Migrate(app, db)
     login_manager.init_app(app)
     bcrypt.init_app(app)
     csrf.init_app(app)
     mail.init_app(app)
-    CORS(app)
+    cors(app)
 
     # Configure login manager
     login_manager.login_view = "auth.login"
@@ -47,6 +101,11 @@ def create_app(config_name="development"):
     app.register_blueprint(auth_bp, url_prefix="/auth")
     app.register_blueprint(admin_bp)
 
+    # Find the admin's models now rather than on the first admin request
+    from app.admin.registry import model_registry
+
+    model_registry.discover_models()
+
     # Register error handlers
     from app.controllers import errors
 
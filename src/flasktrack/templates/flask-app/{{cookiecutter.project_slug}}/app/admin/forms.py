@@ -1,5 +1,7 @@
 """Dynamic form generation for admin interface."""
 
+from functools import cache, partial
+
 from flask_wtf import FlaskForm
 from sqlalchemy import inspect
 from wtforms import (
@@ -16,27 +18,41 @@ from wtforms import (
 )
 from wtforms.validators import DataRequired, Email, Length, Optional
 
+# Fields that should never be editable in admin
+_SKIP_FIELDS = frozenset(
+    {"created_at", "updated_at", "magic_link_token", "magic_link_expires"}
+)
+
+# SQLAlchemy column type name -> WTForms field class
+_FIELD_BY_TYPENAME = {
+    "String": StringField,
+    "Text": TextAreaField,
+    "Integer": IntegerField,
+    "Float": FloatField,
+    "Numeric": DecimalField,
+    "Boolean": BooleanField,
+    "Date": DateField,
+    "DateTime": DateTimeField,
+}
+
+# Attributes tried, in order, as the display label for related records
+_LABEL_ATTRS = ("name", "title", "username", "email")
+
+
+def _coerce_optional_int(value):
+    """Coerce a SelectField value to int, mapping the empty option to None."""
+    if value in ("", None):
+        return None
+    return int(value)
+
 
 def get_field_for_column(column):
     """Map SQLAlchemy column types to WTForms fields."""
-    type_name = column.type.__class__.__name__
-
-    type_mapping = {
-        "String": StringField,
-        "Text": TextAreaField,
-        "Integer": IntegerField,
-        "Float": FloatField,
-        "Numeric": DecimalField,
-        "Boolean": BooleanField,
-        "Date": DateField,
-        "DateTime": DateTimeField,
-    }
-
     # Special handling for password fields
     if "password" in column.name.lower():
         return PasswordField
 
-    return type_mapping.get(type_name, StringField)
+    return _FIELD_BY_TYPENAME.get(column.type.__class__.__name__, StringField)
 
 
 def get_validators_for_column(column):
@@ -59,11 +75,10 @@ def get_validators_for_column(column):
     return validators
 
 
-def create_relationship_field(column, related_model):
-    """Create a SelectField for foreign key relationships."""
+def get_relationship_choices(column, related_model):
+    """Load the current choices for a foreign key SelectField."""
     from app import db
 
-    # Get choices immediately
     choices = []
 
     # Only add the empty option if the field is nullable
@@ -71,22 +86,34 @@ def create_relationship_field(column, related_model):
         choices.append(("", "-- Select --"))
 
     if related_model:
-        items = db.session.query(related_model).all()
-        for item in items:
-            # Try to get a reasonable display value
-            if hasattr(item, "name"):
-                label = item.name
-            elif hasattr(item, "title"):
-                label = item.title
-            elif hasattr(item, "username"):
-                label = item.username
-            elif hasattr(item, "email"):
-                label = item.email
-            else:
-                label = f"{related_model.__name__} #{item.id}"
+        # Pick the display attribute once from the model, not per row
+        label_attr = next(
+            (attr for attr in _LABEL_ATTRS if hasattr(related_model, attr)),
+            None,
+        )
+
+        if label_attr and label_attr in inspect(related_model).column_attrs:
+            # Plain column: fetch only the id and label
+            rows = db.session.query(
+                related_model.id, getattr(related_model, label_attr)
+            ).all()
+            choices.extend((item_id, str(label)) for item_id, label in rows)
+        else:
+            for item in db.session.query(related_model).all():
+                if label_attr:
+                    label = getattr(item, label_attr)
+                else:
+                    label = f"{related_model.__name__} #{item.id}"
+                choices.append((item.id, str(label)))
+
+    return choices
 
-            choices.append((item.id, str(label)))
 
+def create_relationship_field(column):
+    """Create a SelectField for foreign key relationships.
+
+    Choices are filled in per request by AdminForm.
+    """
     # Determine validators based on nullability
     validators = []
     if not column.nullable:
@@ -94,42 +121,45 @@ def create_relationship_field(column, related_model):
     else:
         validators.append(Optional())
 
-    # Use coerce=int only when we have actual values, use str for empty option
-    def coerce_func(value):
-        if value == "":
-            return None
-        return int(value)
-
     field = SelectField(
         label=column.name.replace("_id", "").replace("_", " ").title(),
-        coerce=coerce_func,
-        choices=choices,
+        coerce=_coerce_optional_int,
+        choices=[],
         validators=validators,
     )
     return field
 
 
+class AdminForm(FlaskForm):
+    """Base class for generated admin forms.
+
+    Loads live foreign key choices each time a form is instantiated, so the
+    generated class itself can be cached.
+    """
+
+    _choice_providers = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for field_name, provider in self._choice_providers.items():
+            self[field_name].choices = provider()
+
+
+@cache
 def generate_form_class(model):
     """Dynamically generate a WTForms class from a SQLAlchemy model."""
     mapper = inspect(model)
 
     # Build form fields dictionary
     form_fields = {}
+    choice_providers = {}
 
     # Check if this is a User model - handle password specially
     is_user_model = model.__name__ == "User"
 
-    # Fields that should never be editable in admin
-    skip_fields = [
-        "created_at",
-        "updated_at",
-        "magic_link_token",
-        "magic_link_expires",
-    ]
-
     for column in mapper.columns:
         # Skip primary key and system/internal fields
-        if column.primary_key or column.name in skip_fields:
+        if column.primary_key or column.name in _SKIP_FIELDS:
             continue
 
         # Skip password_hash field for User model - we'll add a password field instead
@@ -138,19 +168,21 @@ def generate_form_class(model):
 
         # Handle foreign keys
         if column.foreign_keys:
-            # Try to find the related model
+            # Find the related model by the referenced table name
+            from app.admin.registry import model_registry
+
             related_model = None
             for fk in column.foreign_keys:
-                table_name = fk.column.table.name
-                # Import all models to find the related one
-                from app.admin.registry import model_registry
-
-                for model_info in model_registry.get_all_models().values():
-                    if model_info["tablename"] == table_name:
-                        related_model = model_info["class"]
-                        break
-
-            field = create_relationship_field(column, related_model)
+                related_model = model_registry.get_model_by_tablename(
+                    fk.column.table.name
+                )
+                if related_model:
+                    break
+
+            field = create_relationship_field(column)
+            choice_providers[column.name] = partial(
+                get_relationship_choices, column, related_model
+            )
         else:
             # Regular field
             field_class = get_field_for_column(column)
@@ -175,6 +207,8 @@ def generate_form_class(model):
             description="Leave blank to keep existing password",
         )
 
+    form_fields["_choice_providers"] = choice_providers
+
     # Create and return the form class
-    form_class = type(f"{model.__name__}Form", (FlaskForm,), form_fields)
+    form_class = type(f"{model.__name__}Form", (AdminForm,), form_fields)
     return form_class
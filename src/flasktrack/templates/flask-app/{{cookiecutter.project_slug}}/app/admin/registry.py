@@ -1,9 +1,12 @@
 """Model discovery and registration for admin interface."""
 
 import importlib
-import inspect
-from pathlib import Path
+import json
+import pkgutil
+import threading
+from types import MappingProxyType
 
+from sqlalchemy import func, literal, select, union_all
 from sqlalchemy import inspect as sqla_inspect
 
 from app import db
@@ -13,92 +16,129 @@ class ModelRegistry:
     """Registry for discovering and managing models in the admin interface."""
 
     def __init__(self):
-        self.models = {}
+        self.models = MappingProxyType({})
+        self._by_tablename = {}
+        self._columns = {}
+        self._counts_stmt = None
+        self._models_json = "{}"
         self._discovered = False
+        self._lock = threading.Lock()
 
     def discover_models(self):
-        """Automatically discover all SQLAlchemy models in the app."""
+        """Discover all SQLAlchemy models in the app.
+
+        Called once by ``create_app``; the accessors below assume it has run.
+        """
         if self._discovered:
             return self.models
 
-        models_dir = Path(__file__).parent.parent / "models"
+        with self._lock:
+            if not self._discovered:
+                self._discover()
+        return self.models
 
-        if not models_dir.exists():
-            return self.models
+    def _discover(self):
+        """Import app.models and read the models off the mapper registry."""
+        import app.models
 
-        for model_file in models_dir.glob("*.py"):
-            if model_file.name.startswith("_"):
+        models = {}
+        module_names = set()
+        for module_info in pkgutil.iter_modules(app.models.__path__):
+            if module_info.name.startswith("_"):
                 continue
 
-            module_name = f"app.models.{model_file.stem}"
-
+            module_name = f"app.models.{module_info.name}"
             try:
-                module = importlib.import_module(module_name)
-
-                for name, obj in inspect.getmembers(module):
-                    if (
-                        inspect.isclass(obj)
-                        and issubclass(obj, db.Model)
-                        and obj != db.Model
-                        and hasattr(obj, "__tablename__")
-                    ):
-                        model_name = name.lower()
-                        self.models[model_name] = {
-                            "class": obj,
-                            "name": name,
-                            "tablename": obj.__tablename__,
-                            "module": module_name,
-                        }
-
+                importlib.import_module(module_name)
             except ImportError:
                 continue
+            module_names.add(module_name)
+
+        # Every mapped class is already in the registry; no getmembers scan
+        classes = sorted(
+            (
+                mapper.class_
+                for mapper in db.Model.registry.mappers
+                if mapper.class_.__module__ in module_names
+                and hasattr(mapper.class_, "__tablename__")
+            ),
+            key=lambda cls: (cls.__module__, cls.__name__),
+        )
+        for cls in classes:
+            models[cls.__name__.lower()] = {
+                "class": cls,
+                "name": cls.__name__,
+                "tablename": cls.__tablename__,
+                "module": cls.__module__,
+                # Statements built once and reused by the admin views; counts
+                # go straight at the table, with no ORM entity or subquery
+                "list_stmt": select(cls),
+                "count_stmt": select(func.count()).select_from(cls.__table__),
+                # Attributes the admin forms may write to
+                "attr_set": frozenset(
+                    attr.key for attr in sqla_inspect(cls).column_attrs
+                ),
+            }
 
+        # Read-only once discovered, so threads can share it without locking
+        self.models = MappingProxyType(models)
+        self._by_tablename = {
+            info["tablename"]: info["class"] for info in models.values()
+        }
+        if models:
+            self._counts_stmt = union_all(
+                *(
+                    select(literal(name), func.count()).select_from(
+                        info["class"].__table__
+                    )
+                    for name, info in self.models.items()
+                )
+            )
+        # Serialized once here; the admin context processor asks every request
+        self._models_json = json.dumps(
+            {
+                name: {"name": info["name"], "tablename": info["tablename"]}
+                for name, info in models.items()
+            }
+        )
         self._discovered = True
-        return self.models
 
     def get_model(self, model_name):
         """Get a model class by name."""
-        if not self._discovered:
-            self.discover_models()
-
         model_info = self.models.get(model_name.lower())
         if model_info:
             return model_info["class"]
         return None
 
+    def get_model_by_tablename(self, tablename):
+        """Get a model class by its table name."""
+        return self._by_tablename.get(tablename)
+
+    def get_counts_statement(self):
+        """Get a UNION ALL statement yielding (model name, row count) rows."""
+        return self._counts_stmt
+
     def get_model_info(self, model_name):
         """Get full model information by name."""
-        if not self._discovered:
-            self.discover_models()
-
         return self.models.get(model_name.lower())
 
     def get_all_models(self):
         """Get all discovered models."""
-        if not self._discovered:
-            self.discover_models()
-
         return self.models
 
     def get_all_models_json(self):
         """Get all discovered models as a JSON string."""
-        import json
-
-        if not self._discovered:
-            self.discover_models()
-
-        # Create a serializable version of the models dictionary
-        serializable_models = {
-            name: {
-                "name": info["name"],
-                "tablename": info["tablename"],
-            }
-            for name, info in self.models.items()
-        }
-        return json.dumps(serializable_models)
+        return self._models_json
 
     def get_model_columns(self, model):
-        """Get column information for a model."""
+        """Get column information for a model, built once per model."""
+        columns = self._columns.get(model)
+        if columns is None:
+            columns = self._columns[model] = self._build_model_columns(model)
+        return columns
+
+    def _build_model_columns(self, model):
+        """Inspect a model's mapper for its column information."""
         mapper = sqla_inspect(model)
         columns = []
 
@@ -39,6 +39,30 @@ class Config:
     MAGIC_LINK_EXPIRY_MINUTES = 15
     SHOW_MAGIC_LINK_IN_TERMINAL = False  # Override in development
 
+    # Always register Flask-Migrate, not just for `flask db` (imports Alembic)
+    MIGRATE_ENABLED = os.environ.get("FLASK_MIGRATE", "false").lower() in [
+        "true",
+        "1",
+        "yes",
+    ]
+
+    # Use WAL journaling with synchronous=NORMAL for SQLite databases
+    SQLITE_WAL = False
+
+    # Werkzeug password hashing method (e.g. "scrypt", "pbkdf2:sha256:600000"),
+    # or "argon2" to hash with argon2-cffi (install it separately)
+    PASSWORD_HASH_METHOD = "scrypt"
+
+    # Check pooled connections before use and replace them every 30 minutes
+    SQLALCHEMY_ENGINE_OPTIONS = {"pool_pre_ping": True, "pool_recycle": 1800}
+
+    # Seconds to reuse the admin dashboard's row counts (0 disables)
+    ADMIN_COUNT_CACHE_SECONDS = 7
+
+    # On PostgreSQL, show the planner's row estimates (which can be stale)
+    # instead of exact counts on the admin dashboard
+    ADMIN_APPROXIMATE_COUNTS = False
+
     @staticmethod
     def init_app(app):
         pass
@@ -59,6 +83,9 @@ class TestingConfig(Config):
 
     TESTING = True
     WTF_CSRF_ENABLED = False
+    # Tests don't need a slow key derivation function
+    PASSWORD_HASH_METHOD = "pbkdf2:sha256:1"
+    ADMIN_COUNT_CACHE_SECONDS = 0
     SQLALCHEMY_DATABASE_URI = (
         os.environ.get("TEST_DATABASE_URL") or "sqlite:///:memory:"
     )
@@ -71,6 +98,17 @@ class ProductionConfig(Config):
         os.environ.get("DATABASE_URL")
         or f"sqlite:///{basedir}/data/{{ cookiecutter.project_slug }}.db"
     )
+    SQLALCHEMY_ECHO = False
+    SQLITE_WAL = True
+
+    # Pool size per process on client/server databases; keep
+    # workers * (pool_size + max_overflow) under the server's max_connections
+    if not SQLALCHEMY_DATABASE_URI.startswith("sqlite"):
+        SQLALCHEMY_ENGINE_OPTIONS = {
+            **Config.SQLALCHEMY_ENGINE_OPTIONS,
+            "pool_size": int(os.environ.get("DB_POOL_SIZE", 5)),
+            "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", 10)),
+        }
 
     @classmethod
     def init_app(cls, app):
@@ -92,3 +130,10 @@ config = {
     "production": ProductionConfig,
     "default": DevelopmentConfig,
 }
+
+# Uppercase settings of each config class, collected once at import so
+# create_app can copy a dict instead of reflecting over the class each time
+config_settings = {
+    name: {key: getattr(cls, key) for key in dir(cls) if key.isupper()}
+    for name, cls in config.items()
+}
@@ -1,7 +1,18 @@
 """Admin blueprint for managing models."""
 
-from flask import Blueprint, flash, redirect, render_template, request, url_for
-from sqlalchemy import String, func, or_
+import time
+from typing import NamedTuple
+
+from flask import (
+    Blueprint,
+    current_app,
+    flash,
+    redirect,
+    render_template,
+    request,
+    url_for,
+)
+from sqlalchemy import String, or_, text
 
 from app import db
 from app.admin.forms import generate_form_class
@@ -10,6 +21,137 @@ from app.decorators import admin_required
 
 admin_bp = Blueprint("admin", __name__, url_prefix="/admin")
 
+# Submitted values that mean "no value" (e.g. an empty foreign key option)
+_NONE_VALUES = frozenset({"", "none", "None"})
+
+# Dashboard row counts: {model names: (monotonic timestamp, {name: count})}
+_count_cache = {}
+
+
+class KeysetPage(NamedTuple):
+    """One page of records, newest first, with cursors to its neighbours."""
+
+    items: list
+    has_next: bool
+    next_after: int | None
+    has_prev: bool
+    prev_before: int | None
+
+
+def keyset_paginate(stmt, model_class, per_page, after_id=None, before_id=None):
+    """Fetch a page by seeking on the primary key instead of OFFSET.
+
+    Rows are ordered by id descending. ``after_id`` moves to older rows and
+    ``before_id`` back to newer ones; each page reads at most per_page + 1
+    rows through the primary key index and never counts the table.
+    """
+    if before_id is not None:
+        rows = db.session.scalars(
+            stmt.where(model_class.id > before_id)
+            .order_by(model_class.id.asc())
+            .limit(per_page + 1)
+        ).all()
+        has_prev = len(rows) > per_page
+        items = rows[:per_page][::-1]
+        has_next = True
+    else:
+        if after_id is not None:
+            stmt = stmt.where(model_class.id < after_id)
+        rows = db.session.scalars(
+            stmt.order_by(model_class.id.desc()).limit(per_page + 1)
+        ).all()
+        has_next = len(rows) > per_page
+        items = rows[:per_page]
+        has_prev = after_id is not None
+
+    return KeysetPage(
+        items=items,
+        has_next=has_next and bool(items),
+        next_after=items[-1].id if items else None,
+        has_prev=has_prev and bool(items),
+        prev_before=items[0].id if items else None,
+    )
+
+
+def get_model_counts(models):
+    """Count rows for every model in one UNION ALL query.
+
+    On PostgreSQL with ADMIN_APPROXIMATE_COUNTS set, the planner's row
+    estimates are read from pg_class instead of scanning every table.
+    Results are reused for ADMIN_COUNT_CACHE_SECONDS; admin creates and
+    deletes clear the cache.
+    """
+    key = tuple(sorted(models))
+    ttl = current_app.config["ADMIN_COUNT_CACHE_SECONDS"]
+    cached = _count_cache.get(key)
+    if ttl and cached and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+
+    counts = None
+    if (
+        models
+        and current_app.config["ADMIN_APPROXIMATE_COUNTS"]
+        and db.engine.dialect.name == "postgresql"
+    ):
+        counts = _approximate_counts(models)
+    if counts is None:
+        counts = {}
+        stmt = model_registry.get_counts_statement()
+        if stmt is not None:
+            counts = dict(db.session.execute(stmt).all())
+
+    _count_cache[key] = (time.monotonic(), counts)
+    return counts
+
+
+def _approximate_counts(models):
+    """Read PostgreSQL's row estimates, or None if any table lacks one."""
+    rows = db.session.execute(
+        text(
+            "SELECT relname, reltuples::bigint FROM pg_class"
+            " WHERE relname = ANY(:names) AND relkind = 'r'"
+            " AND pg_table_is_visible(oid)"
+        ),
+        {"names": [info["tablename"] for info in models.values()]},
+    )
+    estimates = dict(rows.all())
+
+    counts = {}
+    for model_name, info in models.items():
+        # reltuples is -1 until the table has been vacuumed or analyzed
+        estimate = estimates.get(info["tablename"], -1)
+        if estimate < 0:
+            return None
+        counts[model_name] = estimate
+    return counts
+
+
+def apply_form_to_instance(form, instance, attr_set):
+    """Copy submitted form data onto a model instance.
+
+    Args:
+        form: Validated admin form
+        instance: Model instance to update
+        attr_set: Column attribute names of the model
+    """
+    for field_name, field in form._fields.items():
+        if field_name == "password" and type(instance).__name__ == "User":
+            # Only set a password if one was entered; blank keeps the old one
+            if field.data:
+                if hasattr(instance, "set_password"):
+                    instance.set_password(field.data)
+                else:
+                    # Fallback if no set_password method
+                    from werkzeug.security import generate_password_hash
+
+                    instance.password_hash = generate_password_hash(field.data)
+        elif field_name in attr_set:
+            # Handle None values for foreign keys
+            value = field.data
+            if value in _NONE_VALUES:
+                value = None
+            setattr(instance, field_name, value)
+
 
 @admin_bp.context_processor
 def inject_models_json():
@@ -22,17 +164,16 @@ def inject_models_json():
 def dashboard():
     """Admin dashboard showing all available models."""
     models = model_registry.get_all_models()
+    counts = get_model_counts(models)
 
-    # Get counts for each model
-    model_stats = {}
-    for model_name, model_info in models.items():
-        model_class = model_info["class"]
-        count = db.session.query(func.count(model_class.id)).scalar()
-        model_stats[model_name] = {
+    model_stats = {
+        model_name: {
             "name": model_info["name"],
-            "count": count,
+            "count": counts[model_name],
             "tablename": model_info["tablename"],
         }
+        for model_name, model_info in models.items()
+    }
 
     return render_template("admin/dashboard.html", models=model_stats)
 
@@ -41,19 +182,24 @@ def dashboard():
 @admin_required
 def model_list(model_name):
     """List all records for a model."""
-    model_class = model_registry.get_model(model_name)
+    model_info = model_registry.get_model_info(model_name)
 
-    if not model_class:
+    if not model_info:
         flash(f"Model '{model_name}' not found.", "danger")
         return redirect(url_for("admin.dashboard"))
 
+    model_class = model_info["class"]
+
     # Get pagination and search parameters
-    page = request.args.get("page", 1, type=int)
-    per_page = request.args.get("per_page", 25, type=int)
+    after_id = request.args.get("after_id", type=int)
+    before_id = request.args.get("before_id", type=int)
+    per_page = min(max(request.args.get("per_page", 25, type=int), 1), 100)
+    want_count = request.args.get("count", "1") != "0"
     search_query = request.args.get("search", "")
 
-    # Base query
-    query = db.session.query(model_class)
+    # Prebuilt statements for this model
+    stmt = model_info["list_stmt"]
+    count_stmt = model_info["count_stmt"]
 
     # Apply search filter if a query is provided
     if search_query:
@@ -62,12 +208,15 @@ def model_list(model_name):
             if isinstance(column.type, String):
                 search_filters.append(column.ilike(f"%{search_query}%"))
         if search_filters:
-            query = query.filter(or_(*search_filters))
+            search_clause = or_(*search_filters)
+            stmt = stmt.where(search_clause)
+            count_stmt = count_stmt.where(search_clause)
 
-    # Query with pagination
-    pagination = db.paginate(
-        query, page=page, per_page=per_page, error_out=False, max_per_page=100
-    )
+    # Keyset pagination: no COUNT(*) and no OFFSET scan
+    pagination = keyset_paginate(stmt, model_class, per_page, after_id, before_id)
+
+    # The total is a full COUNT(*); ?count=0 skips it for large tables
+    total = db.session.scalar(count_stmt) if want_count else None
 
     # Get column information for display
     columns = model_registry.get_model_columns(model_class)
@@ -78,6 +227,8 @@ def model_list(model_name):
         model_display_name=model_class.__name__,
         items=pagination.items,
         pagination=pagination,
+        total=total,
+        count_param=None if want_count else 0,
         columns=columns,
         search_query=search_query,
     )
@@ -87,12 +238,14 @@ def model_list(model_name):
 @admin_required
 def model_create(model_name):
     """Create a new record for a model."""
-    model_class = model_registry.get_model(model_name)
+    model_info = model_registry.get_model_info(model_name)
 
-    if not model_class:
+    if not model_info:
         flash(f"Model '{model_name}' not found.", "danger")
         return redirect(url_for("admin.dashboard"))
 
+    model_class = model_info["class"]
+
     # Generate form dynamically
     form_class = generate_form_class(model_class)
     form = form_class()
@@ -102,31 +255,12 @@ def model_create(model_name):
         instance = model_class()
 
         # Set values from form
-        for field_name, field in form._fields.items():
-            # Skip CSRF token
-            if field_name == "csrf_token":
-                continue
-
-            # Handle password field specially for User model
-            if field_name == "password" and model_class.__name__ == "User":
-                if field.data:  # Only set password if provided
-                    if hasattr(instance, "set_password"):
-                        instance.set_password(field.data)
-                    else:
-                        # Fallback if no set_password method
-                        from werkzeug.security import generate_password_hash
-
-                        instance.password_hash = generate_password_hash(field.data)
-            elif hasattr(instance, field_name):
-                # Handle None values for foreign keys
-                value = field.data
-                if value == "" or (isinstance(value, str) and value.lower() == "none"):
-                    value = None
-                setattr(instance, field_name, value)
+        apply_form_to_instance(form, instance, model_info["attr_set"])
 
         try:
             db.session.add(instance)
             db.session.commit()
+            _count_cache.clear()
             flash(f"{model_class.__name__} created successfully!", "success")
             return redirect(url_for("admin.model_list", model_name=model_name))
         except Exception as e:
@@ -146,13 +280,15 @@ def model_create(model_name):
 @admin_required
 def model_edit(model_name, id):
     """Edit an existing record."""
-    model_class = model_registry.get_model(model_name)
+    model_info = model_registry.get_model_info(model_name)
 
-    if not model_class:
+    if not model_info:
         flash(f"Model '{model_name}' not found.", "danger")
         return redirect(url_for("admin.dashboard"))
 
-    instance = db.session.query(model_class).get_or_404(id)
+    model_class = model_info["class"]
+
+    instance = db.get_or_404(model_class, id)
 
     # Generate form and populate with instance data
     form_class = generate_form_class(model_class)
@@ -160,28 +296,7 @@ def model_edit(model_name, id):
 
     if form.validate_on_submit():
         # Update instance with form data
-        for field_name, field in form._fields.items():
-            # Skip CSRF token
-            if field_name == "csrf_token":
-                continue
-
-            # Handle password field specially for User model
-            if field_name == "password" and model_class.__name__ == "User":
-                if field.data:  # Only update password if provided
-                    if hasattr(instance, "set_password"):
-                        instance.set_password(field.data)
-                    else:
-                        # Fallback if no set_password method
-                        from werkzeug.security import generate_password_hash
-
-                        instance.password_hash = generate_password_hash(field.data)
-                # Skip if password field is empty (keep existing password)
-            elif hasattr(instance, field_name):
-                # Handle None values for foreign keys
-                value = field.data
-                if value == "" or (isinstance(value, str) and value.lower() == "none"):
-                    value = None
-                setattr(instance, field_name, value)
+        apply_form_to_instance(form, instance, model_info["attr_set"])
 
         try:
             db.session.commit()
@@ -211,11 +326,12 @@ def model_delete(model_name, id):
         flash(f"Model '{model_name}' not found.", "danger")
         return redirect(url_for("admin.dashboard"))
 
-    instance = db.session.query(model_class).get_or_404(id)
+    instance = db.get_or_404(model_class, id)
 
     try:
         db.session.delete(instance)
         db.session.commit()
+        _count_cache.clear()
         flash(f"{model_class.__name__} deleted successfully!", "success")
     except Exception as e:
         db.session.rollback()
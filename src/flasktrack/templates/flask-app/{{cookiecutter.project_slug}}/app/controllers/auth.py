@@ -13,12 +13,38 @@ from flask import (
     url_for,
 )
 from flask_login import current_user, login_required, login_user, logout_user
-from flask_mail import Message
 
-from app import db, mail
+from app import db
 from app.forms.auth import LoginForm, MagicLinkForm, RegistrationForm
 from app.models.user import User
 
+# Magic link email bodies, filled in with str.format when a link is sent
+_MAGIC_LINK_TEXT = """Hello,
+
+Click the link below to log in to your account:
+
+{magic_url}
+
+This link will expire in {expiry} minutes.
+
+If you didn't request this link, please ignore this email.
+
+Best regards,
+The {{ cookiecutter.project_name }} Team
+"""
+
+_MAGIC_LINK_HTML = """<html>
+<body>
+    <p>Hello,</p>
+    <p>Click the button below to log in to your account:</p>
+    <p><a href="{magic_url}" style="display: inline-block; padding: 10px 20px; background-color: #007bff; color: white; text-decoration: none; border-radius: 5px;">Login to {{ cookiecutter.project_name }}</a></p>
+    <p>Or copy and paste this link: <a href="{magic_url}">{magic_url}</a></p>
+    <p>This link will expire in {expiry} minutes.</p>
+    <p>If you didn't request this link, please ignore this email.</p>
+    <p>Best regards,<br>The {{ cookiecutter.project_name }} Team</p>
+</body>
+</html>"""
+
 auth_bp = Blueprint("auth", __name__)
 
 
@@ -59,10 +85,17 @@ def magic_link():
         if not user:
             # Auto-generate username from email
             username = email.split("@")[0]
-            # Ensure username is unique
+            # Ensure username is unique: fetch every name sharing the prefix
+            # in one query (LIKE wildcards only widen the set), then pick the
+            # first free suffix
+            taken = set(
+                db.session.scalars(
+                    db.select(User.username).where(User.username.like(f"{username}%"))
+                )
+            )
             base_username = username
             counter = 1
-            while User.query.filter_by(username=username).first():
+            while username in taken:
                 username = f"{base_username}{counter}"
                 counter += 1
 
@@ -89,35 +122,19 @@ def magic_link():
         else:
             # Send email in production
             try:
+                # Only the sending path needs Flask-Mail's Message class
+                from flask_mail import Message
+
+                from app import mail
+
+                expiry = current_app.config.get("MAGIC_LINK_EXPIRY_MINUTES", 15)
                 msg = Message(
                     "Your Magic Link to Login",
                     recipients=[email],
                     sender=current_app.config.get("MAIL_DEFAULT_SENDER"),
                 )
-                msg.body = f"""Hello,
-
-Click the link below to log in to your account:
-
-{magic_url}
-
-This link will expire in {current_app.config.get("MAGIC_LINK_EXPIRY_MINUTES", 15)} minutes.
-
-If you didn't request this link, please ignore this email.
-
-Best regards,
-The {{ cookiecutter.project_name }} Team
-"""
-                msg.html = f'''<html>
-<body>
-    <p>Hello,</p>
-    <p>Click the button below to log in to your account:</p>
-    <p><a href="{magic_url}" style="display: inline-block; padding: 10px 20px; background-color: #007bff; color: white; text-decoration: none; border-radius: 5px;">Login to {{ cookiecutter.project_name }}</a></p>
-    <p>Or copy and paste this link: <a href="{magic_url}">{magic_url}</a></p>
-    <p>This link will expire in {current_app.config.get("MAGIC_LINK_EXPIRY_MINUTES", 15)} minutes.</p>
-    <p>If you didn't request this link, please ignore this email.</p>
-    <p>Best regards,<br>The {{ cookiecutter.project_name }} Team</p>
-</body>
-</html>'''
+                msg.body = _MAGIC_LINK_TEXT.format(magic_url=magic_url, expiry=expiry)
+                msg.html = _MAGIC_LINK_HTML.format(magic_url=magic_url, expiry=expiry)
                 mail.send(msg)
                 flash(
                     f"Magic link sent to {email}. Please check your email.", "success"
@@ -137,18 +154,13 @@ def verify_magic_link(token):
     if current_user.is_authenticated:
         return redirect(url_for("main.dashboard"))
 
-    # Find user with this token
-    user = User.query.filter_by(magic_link_token=token).first()
+    # The query matches the token digest and rejects expired tokens
+    user = User.find_by_magic_link_token(token)
 
     if not user:
         flash("Invalid or expired magic link.", "danger")
         return redirect(url_for("auth.magic_link"))
 
-    # Verify the token is valid and not expired
-    if not user.verify_magic_link_token(token):
-        flash("Invalid or expired magic link.", "danger")
-        return redirect(url_for("auth.magic_link"))
-
     # Clear the token and log the user in
     user.clear_magic_link_token()
     db.session.commit()
@@ -1,14 +1,25 @@
 """User model."""
 
+import hashlib
 import secrets
 from datetime import datetime, timedelta
+from functools import cache
 
+from flask import current_app
 from flask_login import UserMixin
 from werkzeug.security import check_password_hash, generate_password_hash
 
 from app import db, login_manager
 
 
+@cache
+def _argon2_hasher():
+    """Return a shared argon2 PasswordHasher (needs argon2-cffi)."""
+    from argon2 import PasswordHasher
+
+    return PasswordHasher()
+
+
 class User(UserMixin, db.Model):
     """User model for authentication."""
 
@@ -20,7 +31,8 @@ class User(UserMixin, db.Model):
     password_hash = db.Column(
         db.String(255), nullable=True
     )  # Made nullable for magic link users
-    magic_link_token = db.Column(db.String(255), unique=True, nullable=True)
+    # SHA-256 digest of the emailed token; the raw token is never stored
+    magic_link_token = db.Column(db.LargeBinary(32), unique=True, nullable=True)
     magic_link_expires = db.Column(db.DateTime, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(
@@ -34,10 +46,21 @@ class User(UserMixin, db.Model):
 
     def set_password(self, password):
         """Set password hash."""
-        self.password_hash = generate_password_hash(password)
+        method = current_app.config["PASSWORD_HASH_METHOD"]
+        if method == "argon2":
+            self.password_hash = _argon2_hasher().hash(password)
+        else:
+            self.password_hash = generate_password_hash(password, method=method)
 
     def check_password(self, password):
         """Check if provided password matches the hash."""
+        if self.password_hash and self.password_hash.startswith("$argon2"):
+            from argon2.exceptions import InvalidHashError, VerificationError
+
+            try:
+                return _argon2_hasher().verify(self.password_hash, password)
+            except (InvalidHashError, VerificationError):
+                return False
         return check_password_hash(self.password_hash, password)
 
     @property
@@ -54,21 +77,28 @@ class User(UserMixin, db.Model):
         """Return user id as string."""
         return str(self.id)
 
+    @staticmethod
+    def hash_magic_link_token(token):
+        """Return the digest stored for a magic link token."""
+        return hashlib.sha256(token.encode()).digest()
+
+    @classmethod
+    def find_by_magic_link_token(cls, token):
+        """Find the user holding an unexpired magic link token."""
+        return cls.query.filter(
+            cls.magic_link_token == cls.hash_magic_link_token(token),
+            cls.magic_link_expires > datetime.utcnow(),
+        ).first()
+
     def generate_magic_link_token(self):
-        """Generate a magic link token with expiration."""
-        self.magic_link_token = secrets.token_urlsafe(32)
+        """Generate a magic link token with expiration.
+
+        Only the token's digest is stored; the returned token goes in the link.
+        """
+        token = secrets.token_urlsafe(32)
+        self.magic_link_token = self.hash_magic_link_token(token)
         self.magic_link_expires = datetime.utcnow() + timedelta(minutes=15)
-        return self.magic_link_token
-
-    def verify_magic_link_token(self, token):
-        """Verify if the magic link token is valid and not expired."""
-        if not self.magic_link_token or not self.magic_link_expires:
-            return False
-        if self.magic_link_token != token:
-            return False
-        if datetime.utcnow() > self.magic_link_expires:  # noqa: SIM103
-            return False
-        return True
+        return token
 
     def clear_magic_link_token(self):
         """Clear the magic link token after successful use."""
@@ -78,5 +108,9 @@ class User(UserMixin, db.Model):
 
 @login_manager.user_loader
 def load_user(user_id):
-    """Load user by ID for Flask-Login."""
-    return User.query.get(int(user_id))
+    """Load user by ID for Flask-Login.
+
+    Flask-Login calls this at most once per request and keeps the result in
+    g._login_user; db.session.get checks the identity map before querying.
+    """
+    return db.session.get(User, int(user_id))
@@ -1,33 +1,41 @@
 """Test configuration."""
 
-import os
-import tempfile
+from contextlib import contextmanager
 
 import pytest
+from sqlalchemy import event
+from werkzeug.security import generate_password_hash
 
 from app import create_app, db
 from app.models.user import User
 
 
-@pytest.fixture
-def app():
-    """Create application for testing."""
-    # Create a temporary database file
-    db_fd, db_path = tempfile.mkstemp()
+@pytest.fixture(scope="session")
+def _app():
+    """Create the application and its schema once per test session.
 
+    TestingConfig uses an in-memory SQLite database, so nothing touches disk.
+    """
     app = create_app("testing")
-    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{db_path}"
-    app.config["TESTING"] = True
 
     with app.app_context():
         db.create_all()
-        yield app
-        db.session.remove()
+
+    yield app
+
+    with app.app_context():
         db.drop_all()
 
-    # Clean up the temporary database file
-    os.close(db_fd)
-    os.unlink(db_path)
+
+@pytest.fixture
+def app(_app):
+    """Provide the application in a fresh app context with empty tables."""
+    with _app.app_context():
+        yield _app
+        db.session.remove()
+        for table in reversed(db.metadata.sorted_tables):
+            db.session.execute(table.delete())
+        db.session.commit()
 
 
 @pytest.fixture
@@ -42,11 +50,76 @@ def runner(app):
     return app.test_cli_runner()
 
 
+@pytest.fixture(scope="session")
+def _test_user_password_hash():
+    """Hash the test user's password once, with Werkzeug's default method."""
+    return generate_password_hash("testpass")
+
+
 @pytest.fixture
-def test_user(app):
+def test_user(app, _test_user_password_hash):
     """Create a test user."""
-    user = User(username="testuser", email="test@example.com")
-    user.set_password("testpass")
+    user = User(
+        username="testuser",
+        email="test@example.com",
+        password_hash=_test_user_password_hash,
+    )
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+@pytest.fixture
+def admin_user(app):
+    """Create an admin user."""
+    user = User(
+        username="admin", email="admin@example.com", is_active=True, is_admin=True
+    )
+    user.set_password("admin123")
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+@pytest.fixture
+def auth_user(app):
+    """Create a regular, non-admin user."""
+    user = User(
+        username="testuser", email="test@example.com", is_active=True, is_admin=False
+    )
+    user.set_password("password123")
     db.session.add(user)
     db.session.commit()
     return user
+
+
+@pytest.fixture
+def login_as(client):
+    """Log the test client in as a user without going through the login form."""
+
+    def login(user):
+        with client.session_transaction() as session:
+            session["_user_id"] = str(user.id)
+            session["_fresh"] = True
+
+    return login
+
+
+@pytest.fixture
+def count_queries(app):
+    """Collect the SQL statements run inside a ``with count_queries():`` block."""
+
+    @contextmanager
+    def counter():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+
+    return counter
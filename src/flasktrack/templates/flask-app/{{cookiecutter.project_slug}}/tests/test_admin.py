@@ -1,7 +1,5 @@
 """Tests for admin functionality."""
 
-import pytest
-
 from app import db
 from app.models.user import User
 
@@ -15,50 +13,29 @@ class TestAdminAccess:
         assert response.status_code == 302
         assert "/auth/login" in response.location
 
-    def test_non_admin_cannot_access_dashboard(self, client, auth_user):
+    def test_non_admin_cannot_access_dashboard(self, client, auth_user, login_as):
         """Test that non-admin users cannot access admin dashboard."""
         # Login as regular user
-        client.post(
-            "/auth/login",
-            data={
-                "username": auth_user.username,
-                "password": "password123",
-                "remember_me": False,
-            },
-        )
+        login_as(auth_user)
 
         response = client.get("/admin/")
         assert response.status_code == 302
         assert "/dashboard" in response.location
 
-    def test_admin_can_access_dashboard(self, client, admin_user):
+    def test_admin_can_access_dashboard(self, client, admin_user, login_as):
         """Test that admin users can access admin dashboard."""
         # Login as admin user
-        client.post(
-            "/auth/login",
-            data={
-                "username": admin_user.username,
-                "password": "adminpass123",
-                "remember_me": False,
-            },
-        )
+        login_as(admin_user)
 
         response = client.get("/admin/")
         assert response.status_code == 200
         assert b"Admin Dashboard" in response.data
         assert b"Manage Models" in response.data
 
-    def test_admin_menu_visible_for_admin_users(self, client, admin_user):
+    def test_admin_menu_visible_for_admin_users(self, client, admin_user, login_as):
         """Test that hamburger menu is visible for admin users."""
         # Login as admin user
-        client.post(
-            "/auth/login",
-            data={
-                "username": admin_user.username,
-                "password": "adminpass123",
-                "remember_me": False,
-            },
-        )
+        login_as(admin_user)
 
         response = client.get("/dashboard")
         assert response.status_code == 200
@@ -66,17 +43,12 @@ class TestAdminAccess:
         assert b"admin-menu-icon" in response.data
         assert b"Admin Panel" in response.data
 
-    def test_admin_menu_not_visible_for_regular_users(self, client, auth_user):
+    def test_admin_menu_not_visible_for_regular_users(
+        self, client, auth_user, login_as
+    ):
         """Test that hamburger menu is not visible for regular users."""
         # Login as regular user
-        client.post(
-            "/auth/login",
-            data={
-                "username": auth_user.username,
-                "password": "password123",
-                "remember_me": False,
-            },
-        )
+        login_as(auth_user)
 
         response = client.get("/dashboard")
         assert response.status_code == 200
@@ -88,17 +60,10 @@ class TestAdminAccess:
 class TestAdminModelOperations:
     """Test admin CRUD operations on models."""
 
-    def test_admin_can_list_users(self, client, admin_user, auth_user):
+    def test_admin_can_list_users(self, client, admin_user, auth_user, login_as):
         """Test that admin can view list of users."""
         # Login as admin
-        client.post(
-            "/auth/login",
-            data={
-                "username": admin_user.username,
-                "password": "adminpass123",
-                "remember_me": False,
-            },
-        )
+        login_as(admin_user)
 
         response = client.get("/admin/user/")
         assert response.status_code == 200
@@ -106,17 +71,10 @@ class TestAdminModelOperations:
         assert admin_user.username.encode() in response.data
         assert auth_user.username.encode() in response.data
 
-    def test_admin_can_create_user(self, client, admin_user):
+    def test_admin_can_create_user(self, client, admin_user, login_as):
         """Test that admin can create a new user."""
         # Login as admin
-        client.post(
-            "/auth/login",
-            data={
-                "username": admin_user.username,
-                "password": "adminpass123",
-                "remember_me": False,
-            },
-        )
+        login_as(admin_user)
 
         # Get the create form
         response = client.get("/admin/user/new")
@@ -144,17 +102,10 @@ class TestAdminModelOperations:
         assert user is not None
         assert user.email == "newuser@example.com"
 
-    def test_admin_can_edit_user(self, client, admin_user, auth_user):
+    def test_admin_can_edit_user(self, client, admin_user, auth_user, login_as):
         """Test that admin can edit an existing user."""
         # Login as admin
-        client.post(
-            "/auth/login",
-            data={
-                "username": admin_user.username,
-                "password": "adminpass123",
-                "remember_me": False,
-            },
-        )
+        login_as(admin_user)
 
         # Get the edit form
         response = client.get(f"/admin/user/{auth_user.id}/edit")
@@ -180,7 +131,7 @@ class TestAdminModelOperations:
         db.session.refresh(auth_user)
         assert auth_user.email == "newemail@example.com"
 
-    def test_admin_can_delete_user(self, client, admin_user, app):
+    def test_admin_can_delete_user(self, client, admin_user, app, login_as):
         """Test that admin can delete a user."""
         # Create a user to delete
         with app.app_context():
@@ -193,14 +144,7 @@ class TestAdminModelOperations:
             user_id = user_to_delete.id
 
         # Login as admin
-        client.post(
-            "/auth/login",
-            data={
-                "username": admin_user.username,
-                "password": "adminpass123",
-                "remember_me": False,
-            },
-        )
+        login_as(admin_user)
 
         # Delete the user
         response = client.post(f"/admin/user/{user_id}/delete", follow_redirects=True)
@@ -210,24 +154,17 @@ class TestAdminModelOperations:
 
         # Verify user was deleted
         with app.app_context():
-            user = User.query.get(user_id)
+            user = db.session.get(User, user_id)
             assert user is None
 
 
 class TestAdminModelDiscovery:
     """Test model discovery and registration."""
 
-    def test_admin_discovers_user_model(self, client, admin_user):
+    def test_admin_discovers_user_model(self, client, admin_user, login_as):
         """Test that admin automatically discovers the User model."""
         # Login as admin
-        client.post(
-            "/auth/login",
-            data={
-                "username": admin_user.username,
-                "password": "adminpass123",
-                "remember_me": False,
-            },
-        )
+        login_as(admin_user)
 
         response = client.get("/admin/")
         assert response.status_code == 200
@@ -235,50 +172,12 @@ class TestAdminModelDiscovery:
         assert b"View All" in response.data
         assert b"Add New" in response.data
 
-    def test_admin_shows_model_counts(self, client, admin_user, auth_user):
+    def test_admin_shows_model_counts(self, client, admin_user, auth_user, login_as):
         """Test that admin dashboard shows correct model counts."""
         # Login as admin
-        client.post(
-            "/auth/login",
-            data={
-                "username": admin_user.username,
-                "password": "adminpass123",
-                "remember_me": False,
-            },
-        )
+        login_as(admin_user)
 
         response = client.get("/admin/")
         assert response.status_code == 200
         # Should show at least 2 users (admin and regular)
         assert b"records" in response.data
-
-
-@pytest.fixture
-def admin_user(app):
-    """Create an admin user for testing."""
-    with app.app_context():
-        user = User(
-            username="admin", email="admin@example.com", is_active=True, is_admin=True
-        )
-        user.set_password("adminpass123")
-        db.session.add(user)
-        db.session.commit()
-        db.session.refresh(user)
-        return user
-
-
-@pytest.fixture
-def auth_user(app):
-    """Create a regular authenticated user for testing."""
-    with app.app_context():
-        user = User(
-            username="testuser",
-            email="test@example.com",
-            is_active=True,
-            is_admin=False,
-        )
-        user.set_password("password123")
-        db.session.add(user)
-        db.session.commit()
-        db.session.refresh(user)
-        return user
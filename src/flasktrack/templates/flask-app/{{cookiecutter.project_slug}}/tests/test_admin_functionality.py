@@ -1,38 +1,38 @@
 """Tests for admin functionality with actual models."""
 
+from types import SimpleNamespace
+
 import pytest
 
 from app import db
 from app.models.user import User
 
 
+class Note(db.Model):
+    """A model with an optional foreign key, only used by these tests."""
+
+    __tablename__ = "test_notes"
+
+    id = db.Column(db.Integer, primary_key=True)
+    title = db.Column(db.String(100), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=True)
+
+
 class TestAdminDashboard:
     """Test admin dashboard functionality."""
 
-    def test_admin_dashboard_requires_admin(self, client, auth_user):
+    def test_admin_dashboard_requires_admin(self, client, auth_user, login_as):
         """Test that admin dashboard requires admin privileges."""
         # Login as regular user
-        client.post(
-            "/auth/login",
-            data={
-                "username": auth_user.username,
-                "password": "password123",
-            },
-        )
+        login_as(auth_user)
 
         response = client.get("/admin/")
         assert response.status_code == 302  # Should redirect
 
-    def test_admin_dashboard_shows_models(self, client, admin_user):
+    def test_admin_dashboard_shows_models(self, client, admin_user, login_as):
         """Test that admin dashboard shows available models."""
         # Login as admin
-        client.post(
-            "/auth/login",
-            data={
-                "username": admin_user.username,
-                "password": "admin123",
-            },
-        )
+        login_as(admin_user)
 
         response = client.get("/admin/")
         assert response.status_code == 200
@@ -43,32 +43,58 @@ class TestAdminDashboard:
 class TestAdminUserManagement:
     """Test admin user management functionality."""
 
-    def test_admin_can_list_users(self, client, admin_user, auth_user):
+    def test_admin_can_list_users(
+        self, client, admin_user, auth_user, login_as, count_queries
+    ):
         """Test that admin can view user list."""
         # Login as admin
-        client.post(
-            "/auth/login",
-            data={
-                "username": admin_user.username,
-                "password": "admin123",
-            },
-        )
+        login_as(admin_user)
 
-        response = client.get("/admin/user/")
+        with count_queries() as queries:
+            response = client.get("/admin/user/")
         assert response.status_code == 200
+        # Loading the user, the page of rows and the total; nothing per row
+        assert len(queries) <= 3, queries
         assert admin_user.email.encode() in response.data
         assert auth_user.email.encode() in response.data
 
-    def test_admin_can_create_user_with_password(self, client, admin_user):
+    def test_admin_user_list_keyset_pagination(self, client, admin_user, login_as):
+        """Test that the user list pages by id with after_id/before_id."""
+        db.session.add_all(
+            User(username=f"page{i}", email=f"page{i}@example.com", password_hash="x")
+            for i in range(3)
+        )
+        db.session.commit()
+        newest = db.session.query(User).order_by(User.id.desc()).first()
+
+        login_as(admin_user)
+
+        response = client.get("/admin/user/?per_page=2")
+        assert response.status_code == 200
+        assert newest.email.encode() in response.data
+        assert f"after_id={newest.id - 1}".encode() in response.data
+
+        response = client.get(f"/admin/user/?per_page=2&after_id={newest.id - 1}")
+        assert response.status_code == 200
+        assert newest.email.encode() not in response.data
+        assert b"before_id=" in response.data
+
+    def test_admin_user_list_can_skip_count(self, client, admin_user, login_as):
+        """Test that ?count=0 drops the total from the user list."""
+        login_as(admin_user)
+
+        response = client.get("/admin/user/")
+        assert b"of 1 records" in response.data
+
+        response = client.get("/admin/user/?count=0")
+        assert response.status_code == 200
+        assert b"of 1 records" not in response.data
+        assert b"Showing 1 results" in response.data
+
+    def test_admin_can_create_user_with_password(self, client, admin_user, login_as):
         """Test that admin can create a user with password."""
         # Login as admin
-        client.post(
-            "/auth/login",
-            data={
-                "username": admin_user.username,
-                "password": "admin123",
-            },
-        )
+        login_as(admin_user)
 
         # Create new user with password
         response = client.post(
@@ -98,16 +124,12 @@ class TestAdminUserManagement:
         assert response.status_code == 200
         assert b"Dashboard" in response.data
 
-    def test_admin_can_edit_user_password(self, client, admin_user, auth_user):
+    def test_admin_can_edit_user_password(
+        self, client, admin_user, auth_user, login_as
+    ):
         """Test that admin can change a user's password."""
         # Login as admin
-        client.post(
-            "/auth/login",
-            data={
-                "username": admin_user.username,
-                "password": "admin123",
-            },
-        )
+        login_as(admin_user)
 
         # Edit user's password
         response = client.post(
@@ -124,31 +146,17 @@ class TestAdminUserManagement:
 
         assert response.status_code == 200
 
-        # Verify user can login with new password
-        client.get("/auth/logout")
-        response = client.post(
-            "/auth/login",
-            data={
-                "username": auth_user.username,
-                "password": "newpassword123",
-            },
-            follow_redirects=True,
-        )
-        assert response.status_code == 200
-        assert b"Dashboard" in response.data
+        # Verify the new password is stored (logging in with a password is
+        # covered end to end by test_admin_can_create_user_with_password)
+        user = db.session.get(User, auth_user.id)
+        assert user.check_password("newpassword123")
 
     def test_admin_can_edit_user_without_changing_password(
-        self, client, admin_user, auth_user
+        self, client, admin_user, auth_user, login_as
     ):
         """Test that admin can edit user without changing password."""
         # Login as admin
-        client.post(
-            "/auth/login",
-            data={
-                "username": admin_user.username,
-                "password": "admin123",
-            },
-        )
+        login_as(admin_user)
 
         # Edit user's email only (leave password blank)
         response = client.post(
@@ -165,37 +173,23 @@ class TestAdminUserManagement:
 
         assert response.status_code == 200
 
-        # Verify user can still login with old password
-        client.get("/auth/logout")
-        response = client.post(
-            "/auth/login",
-            data={
-                "username": auth_user.username,
-                "password": "password123",  # Original password
-            },
-            follow_redirects=True,
-        )
-        assert response.status_code == 200
-        assert b"Dashboard" in response.data
+        # Verify the original password still works
+        user = db.session.get(User, auth_user.id)
+        assert user.email == "updated@example.com"
+        assert user.check_password("password123")
 
 
 class TestAdminWithForeignKeys:
     """Test admin functionality with models that have foreign keys."""
 
-    def test_create_model_with_foreign_key(self, client, admin_user, app):
+    def test_create_model_with_foreign_key(self, client, admin_user, app, login_as):
         """Test creating a model that references another model."""
         # Note: This test is designed to work when a Post model (or similar)
         # with a user_id foreign key exists in the application.
         # It demonstrates the admin's ability to handle foreign key relationships.
 
         # Login as admin
-        client.post(
-            "/auth/login",
-            data={
-                "username": admin_user.username,
-                "password": "admin123",
-            },
-        )
+        login_as(admin_user)
 
         # Check if Post model exists
         from app.admin.registry import model_registry
@@ -230,85 +224,37 @@ class TestAdminWithForeignKeys:
                 if created_post:
                     assert created_post.user_id == admin_user.id
 
-    def test_create_model_with_nullable_foreign_key(self, client, admin_user, app):
-        """Test creating a model with an optional foreign key."""
-        # Login as admin
-        client.post(
-            "/auth/login",
-            data={
-                "username": admin_user.username,
-                "password": "admin123",
-            },
+    def test_form_leaves_nullable_foreign_key_empty(self, app, admin_user):
+        """Test an empty choice for an optional foreign key is saved as NULL."""
+        from app.admin.forms import generate_form_class
+        from app.controllers.admin import apply_form_to_instance
+
+        with app.test_request_context(
+            method="POST", data={"title": "Loose note", "user_id": ""}
+        ):
+            form = generate_form_class(Note)()
+            assert form.validate(), form.errors
+
+            note = Note()
+            apply_form_to_instance(form, note, {"title", "user_id"})
+            db.session.add(note)
+            db.session.commit()
+
+        assert db.session.get(Note, note.id).user_id is None
+
+    @pytest.mark.parametrize("raw", ["", "none", "None"])
+    def test_apply_form_maps_none_values(self, app, raw):
+        """Test the empty-option spellings become None on the instance."""
+        from app.controllers.admin import apply_form_to_instance
+
+        form = SimpleNamespace(
+            _fields={
+                "title": SimpleNamespace(data="Loose note"),
+                "user_id": SimpleNamespace(data=raw),
+            }
         )
+        note = Note()
+        apply_form_to_instance(form, note, {"title", "user_id"})
 
-        from app.admin.registry import model_registry
-
-        # Find any model with a nullable foreign key
-        for model_name, model_info in model_registry.get_all_models().items():
-            model_class = model_info["class"]
-            if model_name == "user":  # Skip user model
-                continue
-
-            # Check if this model has nullable foreign keys
-            from sqlalchemy import inspect as sql_inspect
-
-            mapper = sql_inspect(model_class)
-
-            for column in mapper.columns:
-                if column.foreign_keys and column.nullable:
-                    # Test creating without setting the foreign key
-                    response = client.get(f"/admin/{model_name}/new")
-                    if response.status_code == 200:
-                        # Try to create without setting the foreign key
-                        form_data = {}
-
-                        # Fill required fields with dummy data
-                        for col in mapper.columns:
-                            if (
-                                not col.nullable
-                                and not col.primary_key
-                                and not col.foreign_keys
-                            ):
-                                if "String" in col.type.__class__.__name__:
-                                    form_data[col.name] = "Test Value"
-                                elif "Integer" in col.type.__class__.__name__:
-                                    form_data[col.name] = "1"
-                                elif "Boolean" in col.type.__class__.__name__:
-                                    form_data[col.name] = True
-
-                        # Leave the foreign key field empty
-                        form_data[column.name] = ""
-
-                        response = client.post(
-                            f"/admin/{model_name}/new",
-                            data=form_data,
-                            follow_redirects=True,
-                        )
-
-                        # Should not get a TypeError
-                        assert b"TypeError" not in response.data
-                    break
-
-
-@pytest.fixture
-def admin_user(app):
-    """Create an admin user for testing."""
-    user = User(
-        username="admin", email="admin@example.com", is_active=True, is_admin=True
-    )
-    user.set_password("admin123")
-    db.session.add(user)
-    db.session.commit()
-    return user
-
-
-@pytest.fixture
-def auth_user(app):
-    """Create a regular user for testing."""
-    user = User(
-        username="testuser", email="test@example.com", is_active=True, is_admin=False
-    )
-    user.set_password("password123")
-    db.session.add(user)
-    db.session.commit()
-    return user
+        assert note.title == "Loose note"
+        assert note.user_id is None
@@ -1,5 +1,9 @@
 """Test authentication."""
 
+from datetime import datetime, timedelta
+
+from app import db
+
 
 def test_register(client):
     """Test user registration."""
@@ -39,3 +43,35 @@ def test_logout(client, test_user):
     response = client.get("/auth/logout", follow_redirects=True)
     assert response.status_code == 200
     assert b"You have been logged out" in response.data
+
+
+def test_magic_link_logs_in(client, test_user):
+    """A valid magic link logs the user in."""
+    token = test_user.generate_magic_link_token()
+    db.session.commit()
+
+    response = client.get(f"/auth/verify-magic-link/{token}", follow_redirects=True)
+    assert response.status_code == 200
+    assert b"Successfully logged in!" in response.data
+
+
+def test_magic_link_expired(client, test_user):
+    """An expired magic link is rejected."""
+    token = test_user.generate_magic_link_token()
+    test_user.magic_link_expires = datetime.utcnow() - timedelta(minutes=1)
+    db.session.commit()
+
+    response = client.get(f"/auth/verify-magic-link/{token}", follow_redirects=True)
+    assert b"Invalid or expired magic link." in response.data
+
+
+def test_magic_link_single_use(client, test_user):
+    """A magic link cannot be used twice."""
+    token = test_user.generate_magic_link_token()
+    db.session.commit()
+
+    client.get(f"/auth/verify-magic-link/{token}")
+    client.get("/auth/logout")
+
+    response = client.get(f"/auth/verify-magic-link/{token}", follow_redirects=True)
+    assert b"Invalid or expired magic link." in response.data
@@ -3,11 +3,37 @@
 import importlib.util
 import json
 import sys
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
+from weakref import WeakSet
 
 from flask import Flask
 
+# Methods Werkzeug adds to every rule, left out of the route listing
+_HIDDEN_METHODS = frozenset(("HEAD", "OPTIONS"))
+
+# Apps that already have the tracking request hooks registered
+_HOOKED_APPS: WeakSet[Flask] = WeakSet()
+
+# Names conventionally given to a module's Flask instance
+_APP_NAMES = ("app", "application")
+
+# Module-level callables tried, in order, when no Flask instance is found
+_FACTORY_NAMES = ("create_app", "make_app")
+
+
+def _log_request_started() -> None:
+    """Log the start of a request to the tracked app."""
+    print("Request started")
+
+
+def _log_request_completed(response):
+    """Log a finished request and pass its response through."""
+    print(f"Request completed with status {response.status_code}")
+    return response
+
 
 class FlaskTracker:
     """Track and analyze Flask applications."""
@@ -44,9 +70,15 @@ class FlaskTracker:
                     sys.modules["flask_app"] = module
                     spec.loader.exec_module(module)
 
-                    # First, look for Flask app instances
-                    for attr_name in dir(module):
-                        attr = getattr(module, attr_name)
+                    # First, look for Flask app instances, trying the
+                    # conventional names before scanning the whole module
+                    namespace = vars(module)
+                    candidates = [
+                        (name, namespace[name])
+                        for name in _APP_NAMES
+                        if name in namespace
+                    ]
+                    for attr_name, attr in chain(candidates, namespace.items()):
                         if isinstance(attr, Flask):
                             self.app = attr
                             if self.verbose:
@@ -55,34 +87,33 @@ class FlaskTracker:
 
                     # If no Flask instance found, look for factory functions
                     if not self.app:
-                        for attr_name in dir(module):
-                            attr = getattr(module, attr_name)
-                            if callable(attr) and attr_name in [
-                                "create_app",
-                                "make_app",
-                            ]:
-                                try:
-                                    potential_app = attr()
-                                    if isinstance(potential_app, Flask):
-                                        self.app = potential_app
-                                        if self.verbose:
-                                            print(
-                                                f"Created Flask app from factory: {attr_name}"
-                                            )
-                                        break
-                                except Exception as e:
+                        for attr_name in _FACTORY_NAMES:
+                            attr = namespace.get(attr_name)
+                            if not callable(attr):
+                                continue
+                            try:
+                                potential_app = attr()
+                                if isinstance(potential_app, Flask):
+                                    self.app = potential_app
                                     if self.verbose:
                                         print(
-                                            f"Failed to create app from {attr_name}: {e}"
+                                            f"Created Flask app from factory: {attr_name}"
                                         )
-                                    pass
+                                    break
+                            except Exception as e:
+                                if self.verbose:
+                                    print(f"Failed to create app from {attr_name}: {e}")
             except Exception as e:
                 if self.verbose:
                     print(f"Error loading Flask app from {self.app_path}: {e}")
             finally:
-                # Clean up sys.path
-                if path_added and app_dir in sys.path:
-                    sys.path.remove(app_dir)
+                # Clean up sys.path; the entry is still first unless the
+                # app's own imports pushed something in front of it
+                if path_added:
+                    if sys.path[:1] == [app_dir]:
+                        del sys.path[0]
+                    elif app_dir in sys.path:
+                        sys.path.remove(app_dir)
 
         if not self.app:
             self.app = Flask("flasktrack")
@@ -97,16 +128,12 @@ class FlaskTracker:
         if not self.app:
             raise RuntimeError("No Flask application loaded")
 
-        @self.app.before_request
-        def before_request():
-            if self.verbose:
-                print("Request started")
-
-        @self.app.after_request
-        def after_request(response):
-            if self.verbose:
-                print(f"Request completed with status {response.status_code}")
-            return response
+        # The hooks only log, so quiet trackers leave the request path alone.
+        # Repeated calls must not stack another pair of hooks on the app.
+        if self.verbose and self.app not in _HOOKED_APPS:
+            _HOOKED_APPS.add(self.app)
+            self.app.before_request(_log_request_started)
+            self.app.after_request(_log_request_completed)
 
         print(f"Tracking Flask app on {host}:{port}")
         print("Note: This is a tracking wrapper, not running the actual app")
@@ -120,10 +147,11 @@ class FlaskTracker:
         if not self.app:
             return {"error": "No Flask application loaded"}
 
-        routes = self.get_routes()
+        # Only the count is needed, so don't build and sort the route dicts
+        total_routes = sum(1 for _ in self.app.url_map.iter_rules())
 
         return {
-            "total_routes": len(routes),
+            "total_routes": total_routes,
             "app_name": self.app.name,
             "debug_mode": self.app.debug,
             "testing_mode": self.app.testing,
@@ -140,17 +168,16 @@ class FlaskTracker:
         if not self.app:
             return []
 
-        routes = []
-        for rule in self.app.url_map.iter_rules():
-            routes.append(
-                {
-                    "rule": rule.rule,
-                    "endpoint": rule.endpoint,
-                    "methods": list(rule.methods - {"HEAD", "OPTIONS"}),
-                }
-            )
-
-        return sorted(routes, key=lambda x: x["rule"])
+        routes = [
+            {
+                "rule": rule.rule,
+                "endpoint": rule.endpoint,
+                "methods": list(rule.methods - _HIDDEN_METHODS),
+            }
+            for rule in self.app.url_map.iter_rules()
+        ]
+        routes.sort(key=itemgetter("rule"))
+        return routes
 
     def save_analysis(self, analysis: dict[str, Any], output_path: Path) -> None:
         """Save analysis results to a file.
@@ -159,6 +186,5 @@ class FlaskTracker:
             analysis: Analysis results dictionary
             output_path: Path to save the results
         """
-        with open(output_path, "w") as f:
-            json.dump(analysis, f, indent=2)
-            f.write("\n")
+        # Serialize first, then write the whole document at once
+        output_path.write_text(json.dumps(analysis, indent=2) + "\n")
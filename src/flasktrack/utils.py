@@ -1,10 +1,23 @@
 """Utility functions for FlaskTrack."""
 
+import json
 import os
+import re
+import stat
+import subprocess
 import sys
 from pathlib import Path
 from typing import Any
 
+# An import statement for flask or one of its submodules, at the start of a line
+_FLASK_IMPORT_RE = re.compile(
+    rb"^[ \t]*(?:from[ \t]+flask(?:\.\w+)*[ \t]+import|import[ \t]+flask)\b",
+    re.MULTILINE,
+)
+_SCAN_CHUNK_SIZE = 65536
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
 
 def format_size(size_bytes: int) -> str:
     """Format bytes as human-readable string.
@@ -15,11 +28,12 @@ def format_size(size_bytes: int) -> str:
     Returns:
         Human-readable size string
     """
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    # bit_length gives floor(log2) directly; each unit is 10 more bits.
+    # int() lets float sizes through, and truncating doesn't change the unit.
+    index = 0
+    if size_bytes >= 1:
+        index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (index * 10)):.1f} {_SIZE_UNITS[index]}"
 
 
 def get_project_info(project_path: Path) -> dict[str, Any]:
@@ -31,23 +45,56 @@ def get_project_info(project_path: Path) -> dict[str, Any]:
     Returns:
         Dictionary containing project information
     """
+    # One stat call answers exists/is_file/is_dir and gives the size
+    try:
+        st = os.stat(project_path)
+    except OSError:
+        st = None
+
     info = {
         "path": str(project_path),
         "name": project_path.name,
-        "exists": project_path.exists(),
+        "exists": st is not None,
     }
 
-    if project_path.is_file():
+    if st is not None and stat.S_ISREG(st.st_mode):
         info["type"] = "file"
-        info["size"] = format_size(project_path.stat().st_size)
-    elif project_path.is_dir():
+        info["size"] = format_size(st.st_size)
+    elif st is not None and stat.S_ISDIR(st.st_mode):
         info["type"] = "directory"
-        py_files = list(project_path.glob("**/*.py"))
-        info["python_files"] = len(py_files)
+        info["python_files"] = _count_py_files(str(project_path))
 
     return info
 
 
+def _count_py_files(root: str) -> int:
+    """Count the ``.py`` files below a directory.
+
+    Walks with ``os.scandir`` so no ``Path`` objects or file lists are built.
+    Symlinked directories are not followed, and unreadable directories are
+    skipped.
+
+    Args:
+        root: Directory to search
+
+    Returns:
+        Number of Python files found
+    """
+    count = 0
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".py"):
+                        count += 1
+        except OSError:
+            continue
+    return count
+
+
 def validate_flask_app(app_path: Path) -> bool:
     """Validate if a path contains a Flask application.
 
@@ -57,43 +104,33 @@ def validate_flask_app(app_path: Path) -> bool:
     Returns:
         True if valid Flask app found, False otherwise
     """
-    if not app_path.exists():
+    if app_path.suffix != ".py":
         return False
 
-    if app_path.is_file() and app_path.suffix == ".py":
-        content = app_path.read_text()
-        return "from flask import" in content or "import flask" in content
-
+    # Opening the file doubles as the exists/is_file check. Imports usually
+    # sit at the top, so scan in chunks and stop at the first match; each
+    # chunk's unfinished last line is carried over to the next one.
+    try:
+        with app_path.open("rb") as f:
+            tail = b""
+            while chunk := f.read(_SCAN_CHUNK_SIZE):
+                window = tail + chunk
+                if _FLASK_IMPORT_RE.search(window):
+                    return True
+                tail = window[window.rfind(b"\n") + 1 :]
+    except OSError:
+        return False
     return False
 
 
-def add_user_to_app(
-    app_path: Path, username: str, email: str, password: str, is_admin: bool = False
-) -> bool:
-    """Add a new user to a Flask application database.
-
-    Args:
-        app_path: Path to the Flask application directory
-        username: Username for the new user
-        email: Email address for the new user
-        password: Password for the new user
-        is_admin: Whether the user should be an admin (default: False)
-
-    Returns:
-        True if user was added successfully, False otherwise
-    """
-    import subprocess
-    import tempfile
-
-    # Create a Python script to add the user
-    # We use a temp file to execute database operations in the target Flask app's
-    # context, avoiding import conflicts and ensuring proper isolation between
-    # the FlaskTrack process and the target application's environment
-    script_content = f'''
-import sys
+# Runs in a fresh interpreter inside the project directory. The user's
+# details arrive as JSON on stdin, so they are never part of the code.
+_ADD_USER_SCRIPT = """
+import json
 import os
-sys.path.insert(0, "{app_path}")
-os.chdir("{app_path}")
+import sys
+
+sys.path.insert(0, os.getcwd())
 
 # Set environment to development to use SQLite
 os.environ["FLASK_ENV"] = "development"
@@ -101,63 +138,72 @@ os.environ["FLASK_ENV"] = "development"
 from app import create_app, db
 from app.models.user import User
 
-# Create app context
+details = json.load(sys.stdin)
 app = create_app("development")
 
 with app.app_context():
     # Ensure database and tables exist
     db.create_all()
 
-    # Check if user already exists
-    existing_user = User.query.filter(
-        (User.username == "{username}") | (User.email == "{email}")
-    ).first()
-
-    if existing_user:
+    existing_user = db.session.scalar(
+        db.select(User.id)
+        .where(
+            (User.username == details["username"]) | (User.email == details["email"])
+        )
+        .limit(1)
+    )
+    if existing_user is not None:
         print("ERROR: User with this username or email already exists", file=sys.stderr)
         sys.exit(1)
 
-    # Create new user
-    user = User(username="{username}", email="{email}")
-    user.set_password("{password}")
-    user.is_admin = {is_admin}
-
-    # Add and commit
+    user = User(
+        username=details["username"],
+        email=details["email"],
+        is_admin=details["is_admin"],
+    )
+    user.set_password(details["password"])
     db.session.add(user)
     db.session.commit()
+"""
+
 
-    user_type = "Admin" if user.is_admin else "User"
-    print(f"{{user_type}} '{{user.username}}' created successfully")
-'''
+def add_user_to_app(
+    app_path: Path, username: str, email: str, password: str, is_admin: bool = False
+) -> bool:
+    """Add a new user to a Flask application database.
 
-    # Write script to temporary file and execute it
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(script_content)
-        temp_script = f.name
+    The user is created by the project's own app in a separate Python
+    process, so its imports and configuration stay out of FlaskTrack's.
 
-    try:
-        # Run the script in the app's Python environment
-        result = subprocess.run(
-            [sys.executable, temp_script],
-            capture_output=True,
-            text=True,
-            cwd=str(app_path),
-        )
+    Args:
+        app_path: Path to the Flask application directory
+        username: Username for the new user
+        email: Email address for the new user
+        password: Password for the new user
+        is_admin: Whether the user should be an admin (default: False)
 
-        # Clean up temp file
-        os.unlink(temp_script)
-
-        if result.returncode == 0:
-            return True
-        else:
-            # Check if it's a duplicate user error
-            if "already exists" in result.stderr:
-                return False
-            # For other errors, raise an exception with the error message
-            raise Exception(result.stderr or "Unknown error occurred")
-
-    except Exception as e:
-        # Clean up temp file if it still exists
-        if os.path.exists(temp_script):
-            os.unlink(temp_script)
-        raise e
+    Returns:
+        True if user was added successfully, False if the username or email
+        is already taken
+    """
+    details = {
+        "username": username,
+        "email": email,
+        "password": password,
+        "is_admin": is_admin,
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", _ADD_USER_SCRIPT],
+        input=json.dumps(details),
+        capture_output=True,
+        text=True,
+        cwd=str(app_path),
+    )
+
+    if result.returncode == 0:
+        return True
+    # Check if it's a duplicate user error
+    if "already exists" in result.stderr:
+        return False
+    # For other errors, raise an exception with the error message
+    raise Exception(result.stderr or "Unknown error occurred")
@@ -1,10 +1,14 @@
 """Pytest configuration and fixtures."""
 
-import tempfile
+import os
+import shutil
 from pathlib import Path
 
 import pytest
 from flask import Flask
+from typer.testing import CliRunner
+
+from flasktrack.cli import init
 
 
 @pytest.fixture
@@ -31,11 +35,11 @@ def sample_flask_app():
     return app
 
 
-@pytest.fixture
-def flask_app_file(sample_flask_app):
-    """Create a temporary Flask app file."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write("""
+@pytest.fixture(scope="session")
+def flask_app_file(tmp_path_factory):
+    """Create a Flask app file, shared by the whole session; don't modify it."""
+    app_file = tmp_path_factory.mktemp("flask_apps") / "flask_app.py"
+    app_file.write_text("""
 from flask import Flask
 
 app = Flask(__name__)
@@ -56,18 +60,14 @@ def user_detail(user_id):
 def data():
     return {"data": "sample"}
 """)
-        temp_path = Path(f.name)
-
-    yield temp_path
-
-    temp_path.unlink(missing_ok=True)
+    return app_file
 
 
-@pytest.fixture
-def flask_factory_file():
-    """Create a temporary Flask factory file."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write("""
+@pytest.fixture(scope="session")
+def flask_factory_file(tmp_path_factory):
+    """Create a Flask factory file, shared by the whole session."""
+    factory_file = tmp_path_factory.mktemp("flask_apps") / "flask_factory.py"
+    factory_file.write_text("""
 from flask import Flask
 
 def create_app():
@@ -79,8 +79,51 @@ def create_app():
 
     return app
 """)
-        temp_path = Path(f.name)
+    return factory_file
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Create a CLI runner shared by the whole session."""
+    return CliRunner()
+
 
-    yield temp_path
+@pytest.fixture(scope="session")
+def scaffolded_project(tmp_path_factory):
+    """Run ``init`` once per session; copy the tree before modifying it."""
+    project_dir = tmp_path_factory.mktemp("proj") / "test_app"
+    # Only the generated tree matters here; the CLI wiring is tested elsewhere
+    init("test-app", directory=project_dir)
+    return project_dir
 
-    temp_path.unlink(missing_ok=True)
+
+# Files that flasktrack edits in place, so they can't be shared by a link
+_REWRITTEN_FILES = (Path("app", "__init__.py"),)
+
+
+def _link_or_copy(src, dst):
+    """Hard-link a file, copying it where links aren't supported.
+
+    Files flasktrack rewrites are always copied, so editing them in a copy
+    leaves the shared project untouched.
+    """
+    if any(Path(src).parts[-2:] == path.parts for path in _REWRITTEN_FILES):
+        shutil.copy2(src, dst)
+        return
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+@pytest.fixture
+def project_copy(tmp_path, scaffolded_project):
+    """Give a test its own copy of the generated project to modify.
+
+    Files are hard-linked, apart from the ones flasktrack rewrites in place;
+    otherwise it only adds new files, so the shared tree is never written
+    through a link.
+    """
+    project_dir = tmp_path / "test_app"
+    shutil.copytree(scaffolded_project, project_dir, copy_function=_link_or_copy)
+    return project_dir
@@ -2,43 +2,46 @@
 
 import subprocess
 import sys
+from pathlib import Path
 
 import pytest
-from typer.testing import CliRunner
 
+import flasktrack
 from flasktrack.cli import app
-
-runner = CliRunner()
+from flasktrack.utils import add_user_to_app
+
+pytestmark = pytest.mark.integration
+
+# Dependencies of the projects `ft init` generates
+_REQUIREMENTS_FILE = (
+    Path(flasktrack.__file__).parent
+    / "templates"
+    / "flask-app"
+    / "{{cookiecutter.project_slug}}"
+    / "requirements-in.txt"
+)
+
+
+@pytest.fixture(scope="session")
+def _project_dependencies():
+    """Install the generated project's dependencies once per test session."""
+    # Install dependencies using uv to the current environment
+    # This is needed for the generated apps to import
+    deps = _REQUIREMENTS_FILE.read_text().strip().split("\n")
+    # Filter out empty lines and comments
+    deps = [d for d in deps if d and not d.startswith("#")]
+    subprocess.run(
+        ["uv", "pip", "install", "-q"] + deps, check=False, capture_output=True
+    )
 
 
 @pytest.fixture
-def flask_project(tmp_path):
+def flask_project(project_copy, _project_dependencies):
     """Create a real Flask project for testing."""
-    # Use the init command to create a real project
-    project_dir = tmp_path / "test_app"
-    result = runner.invoke(app, ["init", "test-app", "--dir", str(project_dir)])
-
-    # If init fails (e.g., template not available), skip the test
-    if result.exit_code != 0:
-        pytest.skip("Could not create Flask project for testing")
-
-    # Install the required dependencies for the Flask app
-    # We need to install the dependencies listed in the project's requirements
-    requirements_file = project_dir / "requirements-in.txt"
-    if requirements_file.exists():
-        # Install dependencies using uv to the current environment
-        # This is needed for the subprocess calls to work
-        deps = requirements_file.read_text().strip().split("\n")
-        # Filter out empty lines and comments
-        deps = [d for d in deps if d and not d.startswith("#")]
-        subprocess.run(
-            ["uv", "pip", "install", "-q"] + deps, check=False, capture_output=True
-        )
-
-    return project_dir
+    return project_copy
 
 
-def test_add_admin_creates_admin_user(flask_project):
+def test_add_admin_creates_admin_user(runner, flask_project):
     """Test that add-admin command creates a user with admin privileges."""
     # Add an admin user
     result = runner.invoke(
@@ -98,7 +101,7 @@ with app.app_context():
     assert "Is admin: True" in result.stdout
 
 
-def test_add_admin_duplicate_user_fails(flask_project):
+def test_add_admin_duplicate_user_fails(runner, flask_project):
     """Test that adding a duplicate admin fails."""
     # Add first admin
     result = runner.invoke(
@@ -133,7 +136,7 @@ def test_add_admin_duplicate_user_fails(flask_project):
     assert "Failed to add admin" in result.stdout
 
 
-def test_add_admin_duplicate_email_fails(flask_project):
+def test_add_admin_duplicate_email_fails(runner, flask_project):
     """Test that adding an admin with duplicate email fails."""
     # Add first admin
     result = runner.invoke(
@@ -168,7 +171,7 @@ def test_add_admin_duplicate_email_fails(flask_project):
     assert "Failed to add admin" in result.stdout
 
 
-def test_add_admin_with_password_prompt(flask_project):
+def test_add_admin_with_password_prompt(runner, flask_project):
     """Test add-admin command with password prompting."""
     # Use password prompt instead of --password flag
     result = runner.invoke(
@@ -215,7 +218,7 @@ with app.app_context():
     assert "Password is correct" in result.stdout
 
 
-def test_add_multiple_admins(flask_project):
+def test_add_multiple_admins(runner, flask_project):
     """Test adding multiple admin users."""
     admins = [
         ("admin1", "admin1@example.com", "pass1"),
@@ -268,29 +271,51 @@ with app.app_context():
         assert username in result.stdout
 
 
-def test_add_admin_no_flask_app(tmp_path):
-    """Test add-admin command when no Flask app exists."""
-    result = runner.invoke(
-        app,
-        [
-            "add-admin",
-            "testuser",
-            "test@example.com",
-            "--password",
-            "password123",
-            "--app-path",
-            str(tmp_path),
-        ],
-    )
+def test_add_user_with_quotes(flask_project):
+    """Test values with quotes are stored as given, not interpolated."""
+    username = 'o"brien'
+    password = 'it\'s "quoted"'
 
-    assert result.exit_code == 1
-    assert "No Flask application found" in result.stdout
+    assert add_user_to_app(flask_project, username, "ob@example.com", password)
+    assert not add_user_to_app(flask_project, username, "other@example.com", "x")
+
+    check_script = flask_project / "check_quotes.py"
+    check_script.write_text(f"""
+import sys
+from app import create_app
+from app.models.user import User
+
+app = create_app("development")
+with app.app_context():
+    user = User.query.filter_by(username={username!r}).first()
+    sys.exit(0 if user and user.check_password({password!r}) else 1)
+""")
 
+    result = subprocess.run(
+        [sys.executable, str(check_script)],
+        capture_output=True,
+        text=True,
+        cwd=str(flask_project),
+    )
 
-def test_add_admin_no_app_directory(tmp_path):
-    """Test add-admin command when app directory is missing."""
-    # Create app.py but no app directory
-    (tmp_path / "app.py").write_text("from flask import Flask\napp = Flask(__name__)")
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.mark.parametrize(
+    ("files", "expected"),
+    [
+        ({}, "No Flask application found"),
+        (
+            {"app.py": "from flask import Flask\napp = Flask(__name__)"},
+            "No 'app' directory found",
+        ),
+    ],
+    ids=["no_flask_app", "no_app_directory"],
+)
+def test_add_admin_invalid_project(runner, tmp_path, files, expected):
+    """Test add-admin command when the target is not a generated project."""
+    for name, content in files.items():
+        (tmp_path / name).write_text(content)
 
     result = runner.invoke(
         app,
@@ -306,10 +331,10 @@ def test_add_admin_no_app_directory(tmp_path):
     )
 
     assert result.exit_code == 1
-    assert "No 'app' directory found" in result.stdout
+    assert expected in result.stdout
 
 
-def test_regular_user_vs_admin(flask_project):
+def test_regular_user_vs_admin(runner, flask_project):
     """Test that we can distinguish between regular users and admin users."""
     # For this test, we need to create a regular user manually
     # since we don't have an add-user command anymore
@@ -1,15 +1,48 @@
 """Test CLI commands."""
 
-from typer.testing import CliRunner
-
 from flasktrack import __version__
 from flasktrack.cli import app
 
-runner = CliRunner()
-
 
-def test_version():
+def test_version(runner):
     """Test version command."""
-    result = runner.invoke(app, ["version"])
+    result = runner.invoke(app, ["version"], catch_exceptions=False)
     assert result.exit_code == 0
     assert result.stdout.strip() == __version__
+
+
+def test_routes(runner, flask_app_file):
+    """Test routes command lists the application's routes."""
+    result = runner.invoke(app, ["routes", str(flask_app_file)])
+    assert result.exit_code == 0
+    assert "/api/users/<int:user_id>" in result.stdout
+    assert "user_detail" in result.stdout
+
+
+def test_routes_table_for_many_routes(runner, tmp_path):
+    """Test routes command keeps the Rich table however many routes there are."""
+    app_file = tmp_path / "many_routes.py"
+    app_file.write_text(
+        """
+from flask import Flask
+
+app = Flask(__name__)
+
+for i in range(250):
+    app.add_url_rule(f"/items/{i}", f"item_{i}", lambda: "ok")
+"""
+    )
+    result = runner.invoke(app, ["routes", str(app_file)])
+    assert result.exit_code == 0
+    assert "Application Routes" in result.stdout
+    assert "/items/249" in result.stdout
+    assert "ENDPOINT\tMETHODS\tRULE" not in result.stdout
+
+
+def test_routes_plain(runner, flask_app_file):
+    """Test routes --plain prints tab-separated rows."""
+    result = runner.invoke(app, ["routes", str(flask_app_file), "--plain"])
+    assert result.exit_code == 0
+    lines = result.stdout.splitlines()
+    assert lines[0] == "ENDPOINT\tMETHODS\tRULE"
+    assert "user_detail\tGET\t/api/users/<int:user_id>" in lines
@@ -1,156 +1,179 @@
 """Test the init command."""
 
-import os
-import tempfile
 from pathlib import Path
 
-from typer.testing import CliRunner
+from flasktrack.cli import app, init
 
-from flasktrack.cli import app
 
-runner = CliRunner()
-
-
-def test_init_command_creates_project():
+def test_init_command_creates_project(runner, tmp_path):
     """Test that init command creates a Flask project."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        project_dir = Path(tmpdir) / "test_app"
-        result = runner.invoke(app, ["init", "test-app", "--dir", str(project_dir)])
-
-        if result.exit_code != 0:
-            print(f"Exit code: {result.exit_code}")
-            print(f"Output: {result.stdout}")
-            print(f"Exception: {result.exception}")
-
-        assert result.exit_code == 0
-        assert "Creating Flask application: test-app" in result.stdout
-        assert "Project created at:" in result.stdout
-        assert "Your Flask app is ready!" in result.stdout
-
-        # Check that project directory was created
-        assert project_dir.exists()
-        assert project_dir.is_dir()
-
-        # Check for key files and directories
-        assert (project_dir / "app").exists()
-        assert (project_dir / "app" / "__init__.py").exists()
-        assert (project_dir / "app" / "models").exists()
-        assert (project_dir / "app" / "models" / "user.py").exists()
-        assert (project_dir / "app" / "controllers").exists()
-        assert (project_dir / "app" / "controllers" / "auth.py").exists()
-        assert (project_dir / "app" / "forms").exists()
-        assert (project_dir / "app" / "forms" / "auth.py").exists()
-        assert (project_dir / "app" / "views").exists()
-        assert (project_dir / "app" / "static").exists()
-        assert (project_dir / "app" / "config.py").exists()
-        assert (project_dir / "tests").exists()
-        assert (project_dir / "requirements.txt").exists()
-        assert (project_dir / "requirements-dev.txt").exists()
-        assert (project_dir / "requirements-in.txt").exists()
-        assert (project_dir / "requirements-dev-in.txt").exists()
-        assert (project_dir / "app.py").exists()
-        assert (project_dir / ".env").exists()
-        assert (project_dir / ".gitignore").exists()
-        assert (project_dir / "README.md").exists()
-        assert (project_dir / "justfile").exists()
-        assert (project_dir / "data").exists()
-        assert (project_dir / "data" / ".gitkeep").exists()
-
-
-def test_init_command_with_spaces_in_name():
+    project_dir = tmp_path / "test_app"
+    result = runner.invoke(app, ["init", "test-app", "--dir", str(project_dir)])
+
+    if result.exit_code != 0:
+        print(f"Exit code: {result.exit_code}")
+        print(f"Output: {result.stdout}")
+        print(f"Exception: {result.exception}")
+
+    assert result.exit_code == 0
+    assert "Creating Flask application: test-app" in result.stdout
+    assert "Project created at:" in result.stdout
+    assert "Your Flask app is ready!" in result.stdout
+
+    # Check that project directory was created
+    assert project_dir.exists()
+    assert project_dir.is_dir()
+
+    # Check for key files and directories in a single walk of the tree
+    expected = {
+        "app",
+        "app/__init__.py",
+        "app/models",
+        "app/models/user.py",
+        "app/controllers",
+        "app/controllers/auth.py",
+        "app/forms",
+        "app/forms/auth.py",
+        "app/views",
+        "app/static",
+        "app/config.py",
+        "tests",
+        "requirements.txt",
+        "requirements-dev.txt",
+        "requirements-in.txt",
+        "requirements-dev-in.txt",
+        "app.py",
+        ".env",
+        ".gitignore",
+        "README.md",
+        "justfile",
+        "data",
+        "data/.gitkeep",
+    }
+    existing = {p.relative_to(project_dir).as_posix() for p in project_dir.rglob("*")}
+    missing = expected - existing
+    assert not missing, f"missing from generated project: {sorted(missing)}"
+
+
+def test_init_command_with_spaces_in_name(tmp_path, monkeypatch):
     """Test that init command handles project names with spaces."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        project_dir = Path(tmpdir) / "my_flask_app"
-        result = runner.invoke(app, ["init", "My Flask App", "--dir", str(project_dir)])
+    calls = []
+
+    def fake_cookiecutter(template, output_dir, extra_context, **kwargs):
+        calls.append(extra_context)
+        project_path = Path(output_dir) / extra_context["project_slug"]
+        project_path.mkdir()
+        return str(project_path)
 
-        assert result.exit_code == 0
+    # Only the arguments matter here; rendering is covered by the other tests
+    monkeypatch.setattr("cookiecutter.main.cookiecutter", fake_cookiecutter)
+    project_dir = tmp_path / "my_flask_app"
+    init("My Flask App", directory=project_dir)
 
-        # Check that project directory was created
-        assert project_dir.exists()
+    assert calls == [{"project_name": "My Flask App", "project_slug": "my_flask_app"}]
+    # Check that project directory was created
+    assert project_dir.exists()
 
 
-def test_init_command_in_current_directory():
+def test_init_command_in_current_directory(runner, tmp_path, monkeypatch):
     """Test that init command works without --dir option."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Change to temp directory
-        original_cwd = os.getcwd()
-        os.chdir(tmpdir)
+    monkeypatch.chdir(tmp_path)
+
+    result = runner.invoke(app, ["init", "test-app"])
+
+    assert result.exit_code == 0
 
-        try:
-            result = runner.invoke(app, ["init", "test-app"])
+    # Check that project was created in current directory
+    project_dir = tmp_path / "test_app"
+    assert project_dir.exists()
 
-            assert result.exit_code == 0
 
-            # Check that project was created in current directory
-            project_dir = Path(tmpdir) / "test_app"
-            assert project_dir.exists()
-        finally:
-            # Restore original directory
-            os.chdir(original_cwd)
+def _assert_contents(path, required, forbidden=()):
+    """Assert on every expected snippet of a file at once."""
+    text = path.read_text()
+    missing = [snippet for snippet in required if snippet not in text]
+    present = [snippet for snippet in forbidden if snippet in text]
+    assert not missing and not present, (
+        f"{path.name}: missing {missing}, unexpected {present}"
+    )
 
 
-def test_init_command_file_contents():
+def test_init_command_file_contents(scaffolded_project):
     """Test that generated files have correct content."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        project_dir = Path(tmpdir) / "testproject"
-        result = runner.invoke(app, ["init", "TestProject", "--dir", str(project_dir)])
-
-        assert result.exit_code == 0
-
-        # Check that app factory imports are correct
-        app_init = (project_dir / "app" / "__init__.py").read_text()
-        assert "from flask import Flask" in app_init
-        assert "from flask_sqlalchemy import SQLAlchemy" in app_init
-        assert "from flask_login import LoginManager" in app_init
-        assert "def create_app(" in app_init
-
-        # Check User model
-        user_model = (project_dir / "app" / "models" / "user.py").read_text()
-        assert "class User(UserMixin, db.Model):" in user_model
-        assert "def set_password(self, password):" in user_model
-        assert "def check_password(self, password):" in user_model
-
-        # Check auth forms
-        auth_forms = (project_dir / "app" / "forms" / "auth.py").read_text()
-        assert "class LoginForm(FlaskForm):" in auth_forms
-        assert "class RegistrationForm(FlaskForm):" in auth_forms
-
-        # Check requirements-in files
-        requirements_in = (project_dir / "requirements-in.txt").read_text()
-        assert "Flask>=3.0.0" in requirements_in
-        assert "Flask-SQLAlchemy>=3.1.0" in requirements_in
-        assert "Flask-Login>=0.6.0" in requirements_in
-        assert "Flask-WTF>=1.2.0" in requirements_in
-
-        # Check dev requirements-in
-        dev_requirements_in = (project_dir / "requirements-dev-in.txt").read_text()
-        assert "pytest>=8.0.0" in dev_requirements_in
-        assert "ruff>=0.1.0" in dev_requirements_in
-        assert "black" not in dev_requirements_in
-
-        # Check justfile
-        justfile = (project_dir / "justfile").read_text()
-        assert "install:" in justfile
-        assert "run:" in justfile
-        assert "test:" in justfile
-        assert "uv pip compile" in justfile
-        assert "uv pip sync" in justfile
-        assert "uv run --no-project flask" in justfile
-        assert "mkdir -p data" in justfile
-        assert "ruff format" in justfile
-        assert "ruff check" in justfile
-        assert "black" not in justfile
-        # Verify host is set to localhost instead of 0.0.0.0
-        assert "--host=127.0.0.1" in justfile
-        assert "--host=0.0.0.0" not in justfile
-
-        # Check app.py has correct host configuration
-        app_py = (project_dir / "app.py").read_text()
-        assert 'host="127.0.0.1"' in app_py
-        assert 'host="0.0.0.0"' not in app_py
-
-
-def test_init_command_requires_project_name():
+    project_dir = scaffolded_project
+
+    # Check that app factory imports are correct
+    _assert_contents(
+        project_dir / "app" / "__init__.py",
+        [
+            "from flask import Flask",
+            "from flask_sqlalchemy import SQLAlchemy",
+            "from flask_login import LoginManager",
+            "def create_app(",
+        ],
+    )
+
+    # Check User model
+    _assert_contents(
+        project_dir / "app" / "models" / "user.py",
+        [
+            "class User(UserMixin, db.Model):",
+            "def set_password(self, password):",
+            "def check_password(self, password):",
+        ],
+    )
+
+    # Check auth forms
+    _assert_contents(
+        project_dir / "app" / "forms" / "auth.py",
+        ["class LoginForm(FlaskForm):", "class RegistrationForm(FlaskForm):"],
+    )
+
+    # Check requirements-in files
+    _assert_contents(
+        project_dir / "requirements-in.txt",
+        [
+            "Flask>=3.0.0",
+            "Flask-SQLAlchemy>=3.1.0",
+            "Flask-Login>=0.6.0",
+            "Flask-WTF>=1.2.0",
+        ],
+    )
+
+    # Check dev requirements-in
+    _assert_contents(
+        project_dir / "requirements-dev-in.txt",
+        ["pytest>=8.0.0", "ruff>=0.1.0"],
+        forbidden=["black"],
+    )
+
+    # Check justfile; host is localhost instead of 0.0.0.0
+    _assert_contents(
+        project_dir / "justfile",
+        [
+            "install:",
+            "run:",
+            "test:",
+            "uv pip compile",
+            "uv pip sync",
+            "uv run --no-project flask",
+            "mkdir -p data",
+            "ruff format",
+            "ruff check",
+            "--host=127.0.0.1",
+        ],
+        forbidden=["black", "--host=0.0.0.0"],
+    )
+
+    # Check app.py has correct host configuration
+    _assert_contents(
+        project_dir / "app.py",
+        ['host="127.0.0.1"'],
+        forbidden=['host="0.0.0.0"'],
+    )
+
+
+def test_init_command_requires_project_name(runner):
     """Test that init command requires project name and fails without it."""
     result = runner.invoke(app, ["init"])
 
@@ -159,71 +182,56 @@ def test_init_command_requires_project_name():
     assert "flasktrack init [PROJECT_NAME]" in result.stdout
 
 
-def test_init_command_with_dot_uses_directory_name():
+def test_init_command_with_dot_uses_directory_name(runner, tmp_path, monkeypatch):
     """Test that init command with '.' uses current directory name."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create a subdirectory with a specific name
-        test_dir = Path(tmpdir) / "my-awesome-app"
-        test_dir.mkdir()
-
-        # Change to that directory
-        original_cwd = os.getcwd()
-        os.chdir(str(test_dir))
-
-        try:
-            result = runner.invoke(app, ["init", "."])
-
-            assert result.exit_code == 0
-            assert "Using current directory name: my-awesome-app" in result.stdout
-            assert "Creating Flask application: my-awesome-app" in result.stdout
-
-            # Check that project was created in current directory
-            project_dir = (
-                test_dir / "my_awesome_app"
-            )  # cookiecutter converts hyphens to underscores
-            assert project_dir.exists()
-            assert (project_dir / "app").exists()
-            assert (project_dir / "justfile").exists()
-        finally:
-            # Restore original directory
-            os.chdir(original_cwd)
-
-
-def test_generated_project_flask_app_works():
+    # Create a subdirectory with a specific name
+    test_dir = tmp_path / "my-awesome-app"
+    test_dir.mkdir()
+    monkeypatch.chdir(test_dir)
+
+    result = runner.invoke(app, ["init", "."])
+
+    assert result.exit_code == 0
+    assert "Using current directory name: my-awesome-app" in result.stdout
+    assert "Creating Flask application: my-awesome-app" in result.stdout
+
+    # Check that project was created in current directory
+    project_dir = (
+        test_dir / "my_awesome_app"
+    )  # cookiecutter converts hyphens to underscores
+    assert project_dir.exists()
+    assert (project_dir / "app").exists()
+    assert (project_dir / "justfile").exists()
+
+
+def test_generated_project_flask_app_works(scaffolded_project):
     """Test that generated project Flask app structure is correct."""
-    import sys
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        project_dir = Path(tmpdir) / "flask_integration_test"
-        result = runner.invoke(
-            app, ["init", "Flask Integration Test", "--dir", str(project_dir)]
-        )
-
-        assert result.exit_code == 0
-
-        # Add the generated project to Python path
-        sys.path.insert(0, str(project_dir))
-
-        try:
-            # Check that the app module structure is correct
-            assert (project_dir / "app" / "__init__.py").exists()
-            assert (project_dir / "app" / "models" / "user.py").exists()
-            assert (project_dir / "app" / "controllers" / "auth.py").exists()
-            assert (project_dir / "app" / "controllers" / "main.py").exists()
-
-            # Read and verify the app factory function exists
-            app_init_content = (project_dir / "app" / "__init__.py").read_text()
-            assert "def create_app" in app_init_content
-            assert "from flask import Flask" in app_init_content
-            assert "from flask_bcrypt import Bcrypt" in app_init_content
-
-            # Verify requirements are properly set up
-            requirements_content = (project_dir / "requirements.txt").read_text()
-            assert "flask==" in requirements_content.lower()
-            assert "flask-bcrypt==" in requirements_content.lower()
-            assert "flask-login==" in requirements_content.lower()
-
-        finally:
-            # Clean up Python path
-            if str(project_dir) in sys.path:
-                sys.path.remove(str(project_dir))
+    project_dir = scaffolded_project
+
+    # Check that the app module structure is correct
+    assert (project_dir / "app" / "__init__.py").exists()
+    assert (project_dir / "app" / "models" / "user.py").exists()
+    assert (project_dir / "app" / "controllers" / "auth.py").exists()
+    assert (project_dir / "app" / "controllers" / "main.py").exists()
+
+    # Read and verify the app factory function exists
+    app_init_content = (project_dir / "app" / "__init__.py").read_text()
+    assert "def create_app" in app_init_content
+    assert "from flask import Flask" in app_init_content
+    assert "from flask_bcrypt import Bcrypt" in app_init_content
+
+    # Verify requirements are properly set up
+    requirements_content = (project_dir / "requirements.txt").read_text()
+    assert "flask==" in requirements_content.lower()
+    assert "flask-bcrypt==" in requirements_content.lower()
+    assert "flask-login==" in requirements_content.lower()
+
+
+def test_init_command_ignores_user_cookiecutter_config(runner, tmp_path, monkeypatch):
+    """Test that init does not depend on the user's cookiecutter config."""
+    monkeypatch.setenv("COOKIECUTTER_CONFIG", str(tmp_path / "missing.yaml"))
+    project_dir = tmp_path / "test_app"
+    result = runner.invoke(app, ["init", "test-app", "--dir", str(project_dir)])
+
+    assert result.exit_code == 0
+    assert (project_dir / "app" / "__init__.py").exists()
@@ -1,26 +1,12 @@
 """Tests for the scaffold command."""
 
 import pytest
-from typer.testing import CliRunner
 
 from flasktrack.cli import app
 from flasktrack.scaffold import Scaffold
 
-
-@pytest.fixture
-def runner():
-    """Create a CLI runner for testing."""
-    return CliRunner()
-
-
-@pytest.fixture
-def flask_app_dir(tmp_path):
-    """Create a minimal Flask app structure for testing."""
-    app_dir = tmp_path / "app"
-    app_dir.mkdir()
-
-    # Create minimal __init__.py
-    init_content = '''"""Flask application factory."""
+# Minimal app/__init__.py, stored encoded so each fixture call just writes it
+_APP_INIT = b'''"""Flask application factory."""
 
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
@@ -51,7 +37,16 @@ def create_app(config_name="development"):
 
     return app
 '''
-    (app_dir / "__init__.py").write_text(init_content)
+
+
+@pytest.fixture
+def flask_app_dir(tmp_path):
+    """Create a minimal Flask app structure for testing."""
+    app_dir = tmp_path / "app"
+    app_dir.mkdir()
+
+    # Create minimal __init__.py
+    (app_dir / "__init__.py").write_bytes(_APP_INIT)
 
     # Create necessary subdirectories
     (app_dir / "models").mkdir()
@@ -77,17 +72,17 @@ class TestScaffoldClass:
         )
 
         assert len(scaffold.fields) == 3
-        assert scaffold.fields[0]["name"] == "title"
-        assert scaffold.fields[0]["type"] == "string"
-        assert scaffold.fields[0]["sqlalchemy_type"] == "db.String(255)"
+        assert scaffold.fields[0].name == "title"
+        assert scaffold.fields[0].type == "string"
+        assert scaffold.fields[0].sqlalchemy_type == "db.String(255)"
 
-        assert scaffold.fields[1]["name"] == "content"
-        assert scaffold.fields[1]["type"] == "text"
-        assert scaffold.fields[1]["sqlalchemy_type"] == "db.Text"
+        assert scaffold.fields[1].name == "content"
+        assert scaffold.fields[1].type == "text"
+        assert scaffold.fields[1].sqlalchemy_type == "db.Text"
 
-        assert scaffold.fields[2]["name"] == "published"
-        assert scaffold.fields[2]["type"] == "boolean"
-        assert scaffold.fields[2]["sqlalchemy_type"] == "db.Boolean"
+        assert scaffold.fields[2].name == "published"
+        assert scaffold.fields[2].type == "boolean"
+        assert scaffold.fields[2].sqlalchemy_type == "db.Boolean"
 
     def test_parse_fields_references(self):
         """Test parsing reference fields."""
@@ -95,15 +90,15 @@ class TestScaffoldClass:
             "Comment", ["body:text", "post:references", "user:belongs_to"]
         )
 
-        assert scaffold.fields[1]["name"] == "post"
-        assert scaffold.fields[1]["type"] == "references"
-        assert scaffold.fields[1]["is_reference"] is True
-        assert scaffold.fields[1]["referenced_model"] == "Post"
+        assert scaffold.fields[1].name == "post"
+        assert scaffold.fields[1].type == "references"
+        assert scaffold.fields[1].is_reference is True
+        assert scaffold.fields[1].referenced_model == "Post"
 
-        assert scaffold.fields[2]["name"] == "user"
-        assert scaffold.fields[2]["type"] == "belongs_to"
-        assert scaffold.fields[2]["is_reference"] is True
-        assert scaffold.fields[2]["referenced_model"] == "User"
+        assert scaffold.fields[2].name == "user"
+        assert scaffold.fields[2].type == "belongs_to"
+        assert scaffold.fields[2].is_reference is True
+        assert scaffold.fields[2].referenced_model == "User"
 
     def test_parse_fields_invalid_type(self):
         """Test that invalid field types raise an error."""
@@ -115,9 +110,9 @@ class TestScaffoldClass:
         with pytest.raises(ValueError, match="Invalid field definition"):
             Scaffold("Post", ["title"])
 
-    def test_pluralization(self):
-        """Test model name pluralization."""
-        tests = [
+    @pytest.mark.parametrize(
+        ("singular", "expected_plural"),
+        [
             ("post", "posts"),
             ("category", "categories"),
             ("person", "people"),
@@ -128,11 +123,12 @@ class TestScaffoldClass:
             ("church", "churches"),
             ("knife", "knives"),
             ("life", "lives"),
-        ]
-
-        for singular, expected_plural in tests:
-            scaffold = Scaffold(singular.capitalize(), [])
-            assert scaffold.name_plural == expected_plural
+        ],
+    )
+    def test_pluralization(self, singular, expected_plural):
+        """Test model name pluralization."""
+        scaffold = Scaffold(singular.capitalize(), [])
+        assert scaffold.name_plural == expected_plural
 
     def test_generate_model(self):
         """Test model generation."""
@@ -160,6 +156,36 @@ class TestScaffoldClass:
         assert "# TODO: Add these relationships to the referenced models:" in model_code
         assert "# In Author model:" in model_code
 
+    def test_generate_model_all_field_types(self):
+        """Test model generation with all supported field types."""
+        fields = [
+            "name:string",
+            "description:text",
+            "age:integer",
+            "price:float",
+            "cost:decimal",
+            "active:boolean",
+            "birth_date:date",
+            "created:datetime",
+            "user:references",
+        ]
+
+        model_content = Scaffold("Product", fields).generate_model()
+
+        expected = [
+            "name = db.Column(db.String(255)",
+            "description = db.Column(db.Text",
+            "age = db.Column(db.Integer",
+            "price = db.Column(db.Float",
+            "cost = db.Column(db.Numeric",
+            "active = db.Column(db.Boolean",
+            "birth_date = db.Column(db.Date",
+            "created = db.Column(db.DateTime",
+            "user_id = db.Column(db.Integer, db.ForeignKey",
+        ]
+        missing = [column for column in expected if column not in model_content]
+        assert not missing, missing
+
     def test_generate_controller(self):
         """Test controller generation."""
         scaffold = Scaffold("Post", ["title:string", "content:text"])
@@ -187,6 +213,15 @@ class TestScaffoldClass:
 
         # Check for login_required decorators
         assert "@login_required" in controller_code
+        assert "selectinload" not in controller_code
+
+    def test_generate_controller_eager_loads_references(self):
+        """Test the index view loads referenced records up front."""
+        scaffold = Scaffold("Comment", ["body:text", "post:references"])
+        controller_code = scaffold.generate_controller()
+
+        assert "from sqlalchemy.orm import selectinload" in controller_code
+        assert "selectinload(Comment.post)," in controller_code
 
     def test_generate_form(self):
         """Test form generation."""
@@ -248,11 +283,18 @@ class TestScaffoldCommand:
         assert "Created app/views/posts/edit.html" in result.output
         assert "Created app/views/posts/_form.html" in result.output
 
-        # Check files exist
-        assert (flask_app_dir / "app/models/post.py").exists()
-        assert (flask_app_dir / "app/controllers/posts.py").exists()
-        assert (flask_app_dir / "app/forms/post.py").exists()
-        assert (flask_app_dir / "app/views/posts/index.html").exists()
+        # Check files exist, in a single walk of the app tree
+        existing = {
+            p.relative_to(flask_app_dir).as_posix()
+            for p in (flask_app_dir / "app").rglob("*")
+        }
+        expected = {
+            "app/models/post.py",
+            "app/controllers/posts.py",
+            "app/forms/post.py",
+            "app/views/posts/index.html",
+        }
+        assert not expected - existing, sorted(expected - existing)
 
     def test_scaffold_with_references(self, runner, flask_app_dir, monkeypatch):
         """Test scaffold with reference fields."""
@@ -284,6 +326,18 @@ class TestScaffoldCommand:
         assert "from app.controllers.posts import posts_bp" in init_content
         assert "app.register_blueprint(posts_bp" in init_content
 
+    def test_scaffold_updates_app_init_twice(self, runner, flask_app_dir, monkeypatch):
+        """Test that a second scaffold leaves app/__init__.py valid and ordered."""
+        monkeypatch.chdir(flask_app_dir)
+
+        runner.invoke(app, ["scaffold", "Post", "title:string"])
+        runner.invoke(app, ["scaffold", "Comment", "body:text"])
+
+        init_content = (flask_app_dir / "app/__init__.py").read_text()
+        compile(init_content, "__init__.py", "exec")
+        assert init_content.index("posts_bp") < init_content.index("comments_bp")
+        assert "app.register_blueprint(comments_bp" in init_content
+
     def test_scaffold_skip_init_option(self, runner, flask_app_dir, monkeypatch):
         """Test scaffold with --skip-init option."""
         monkeypatch.chdir(flask_app_dir)
@@ -309,6 +363,36 @@ class TestScaffoldCommand:
         assert result.exit_code == 1
         assert "already exists" in result.output
 
+    def test_scaffold_existing_controller_leaves_no_model(
+        self, runner, flask_app_dir, monkeypatch
+    ):
+        """Test that a clash on a later file removes the files already written."""
+        monkeypatch.chdir(flask_app_dir)
+
+        (flask_app_dir / "app/controllers/posts.py").touch()
+
+        result = runner.invoke(app, ["scaffold", "Post", "title:string"])
+
+        assert result.exit_code == 1
+        assert "Controller already exists" in result.output
+        assert not (flask_app_dir / "app/models/post.py").exists()
+
+    def test_scaffold_with_app_path(self, runner, flask_app_dir, tmp_path, monkeypatch):
+        """Test that --app-path scaffolds into another directory."""
+        outside = tmp_path / "elsewhere"
+        outside.mkdir()
+        monkeypatch.chdir(outside)
+
+        result = runner.invoke(
+            app,
+            ["scaffold", "Post", "title:string", "--app-path", str(flask_app_dir)],
+        )
+
+        assert result.exit_code == 0
+        assert "Created app/models/post.py" in result.output
+        assert (flask_app_dir / "app/models/post.py").exists()
+        assert not (outside / "app").exists()
+
     def test_scaffold_not_in_flask_app(self, runner, tmp_path, monkeypatch):
         """Test that scaffold fails when not in a Flask app directory."""
         monkeypatch.chdir(tmp_path)
@@ -326,35 +410,3 @@ class TestScaffoldCommand:
 
         assert result.exit_code == 1
         assert "Invalid field type" in result.output
-
-    def test_scaffold_all_field_types(self, runner, flask_app_dir, monkeypatch):
-        """Test scaffold with all supported field types."""
-        monkeypatch.chdir(flask_app_dir)
-
-        fields = [
-            "name:string",
-            "description:text",
-            "age:integer",
-            "price:float",
-            "cost:decimal",
-            "active:boolean",
-            "birth_date:date",
-            "created:datetime",
-            "user:references",
-        ]
-
-        result = runner.invoke(app, ["scaffold", "Product"] + fields)
-
-        assert result.exit_code == 0
-
-        # Check model file for all types
-        model_content = (flask_app_dir / "app/models/product.py").read_text()
-        assert "name = db.Column(db.String(255)" in model_content
-        assert "description = db.Column(db.Text" in model_content
-        assert "age = db.Column(db.Integer" in model_content
-        assert "price = db.Column(db.Float" in model_content
-        assert "cost = db.Column(db.Numeric" in model_content
-        assert "active = db.Column(db.Boolean" in model_content
-        assert "birth_date = db.Column(db.Date" in model_content
-        assert "created = db.Column(db.DateTime" in model_content
-        assert "user_id = db.Column(db.Integer, db.ForeignKey" in model_content
@@ -1,22 +1,13 @@
 """Integration test for scaffold generation with a full project."""
 
-import os
-import tempfile
-from pathlib import Path
-
 import pytest
-from typer.testing import CliRunner
 
 from flasktrack.cli import app
 
-
-@pytest.fixture
-def runner():
-    """Create a CLI runner for testing."""
-    return CliRunner()
+pytestmark = pytest.mark.integration
 
 
-def test_scaffold_integration_with_user_and_posts(runner):
+def test_scaffold_integration_with_user_and_posts(runner, project_copy):
     """Test scaffolding Post with user:belongs_to in a new project.
 
     This test reveals the Jinja2 template issues where:
@@ -24,246 +15,205 @@ def test_scaffold_integration_with_user_and_posts(runner):
     2. Templates have unrendered variables like {{ model_name }}
     3. Templates have invalid nested syntax like {{ form.{{ field.name }} }}
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        project_dir = Path(tmpdir) / "test_blog"
-
-        # Step 1: Create a new project
-        result = runner.invoke(app, ["init", "test-blog", "--dir", str(project_dir)])
-        assert result.exit_code == 0, f"Failed to create project: {result.stdout}"
-        assert project_dir.exists()
-
-        # Change to project directory
-        original_cwd = os.getcwd()
-        os.chdir(str(project_dir))
-
-        try:
-            # Step 2: Run just install (simulate it since we can't run actual subprocess in tests)
-            # In a real scenario, this would install dependencies
-            # We'll verify the files exist that would be needed
-            assert (project_dir / "justfile").exists()
-            assert (project_dir / "requirements.txt").exists()
-
-            # Step 3: Add Post scaffold with user:belongs_to
-            result = runner.invoke(
-                app,
-                ["scaffold", "Post", "title:string", "content:text", "user:belongs_to"],
-            )
-            assert result.exit_code == 0, f"Failed to scaffold Post: {result.stdout}"
-
-            # Verify scaffold files were created
-            assert (project_dir / "app" / "models" / "post.py").exists()
-            assert (project_dir / "app" / "controllers" / "posts.py").exists()
-            assert (project_dir / "app" / "forms" / "post.py").exists()
-            assert (project_dir / "app" / "views" / "posts" / "new.html").exists()
-            assert (project_dir / "app" / "views" / "posts" / "edit.html").exists()
-            assert (project_dir / "app" / "views" / "posts" / "_form.html").exists()
-
-            # Step 4: Check the actual generated view templates
-            new_view = (
-                project_dir / "app" / "views" / "posts" / "new.html"
-            ).read_text()
-
-            # ISSUES TO FIX:
-            # 1. Templates should NOT contain {% raw %} tags
-            assert "{% raw %}" not in new_view, (
-                "Template contains {% raw %} tags which shouldn't be in final output"
-            )
-
-            # 2. Template variables should be rendered (not contain {{ model_name }})
-            assert "{{ model_name }}" not in new_view, (
-                "Template contains unrendered {{ model_name }} variable"
-            )
-            assert "<h1>New Post</h1>" in new_view, (
-                "Title should be rendered as 'New Post' not 'New {{ model_name }}'"
-            )
-
-            # 3. Include statements should be properly rendered
-            assert '{% include "posts/_form.html" %}' in new_view, (
-                "Include should reference 'posts/_form.html' not '{{ model_name_plural }}/_form.html'"
-            )
-
-            # 4. URL for should be properly rendered
-            assert "{{ url_for('posts.index') }}" in new_view, (
-                "URL should be for 'posts.index' not '{{ model_name_plural }}.index'"
-            )
-
-            # Check the form partial
-            form_view = (
-                project_dir / "app" / "views" / "posts" / "_form.html"
-            ).read_text()
-
-            # ISSUES TO FIX IN _form.html:
-            # 1. Should not contain {% raw %} tags
-            assert "{% raw %}" not in form_view, "Form template contains {% raw %} tags"
-
-            # 2. Should not have invalid nested syntax like {{ form.{{ field.name }} }}
-            # This is currently broken and creates invalid Jinja2
-            assert "{{ form.{{ field.name }}" not in form_view, (
-                "Form has invalid nested template syntax"
-            )
-
-            # 3. The form should have properly rendered field names
-            # Instead of a loop, it should have actual field names
-            assert (
-                "{{ form.title.label" in form_view
-                or "{% for field in fields %}" in form_view
-            )
-
-            # These are what we'd expect if the template was properly generated:
-            # assert '{{ form.title.label' in form_view
-            # assert '{{ form.title(' in form_view
-            # assert '{{ form.content.label' in form_view
-            # assert '{{ form.content(' in form_view
-            # assert '{{ form.user_id.label' in form_view
-            # assert '{{ form.user_id(' in form_view
-
-            # Verify the controller has the proper route
-            controller_content = (
-                project_dir / "app" / "controllers" / "posts.py"
-            ).read_text()
-            assert (
-                '@posts_bp.route("/new", methods=["GET", "POST"])' in controller_content
-            )
-            assert "def new():" in controller_content
-            assert "form = PostForm()" in controller_content
-            assert (
-                'return render_template("posts/new.html", form=form)'
-                in controller_content
-            )
-
-            # Verify the form has user_id field
-            form_content = (project_dir / "app" / "forms" / "post.py").read_text()
-            assert 'user_id = SelectField("User"' in form_content
-            assert "from app.models.user import User" in form_content
-            assert "def __init__(self, *args, **kwargs):" in form_content
-            assert "User.query.all()" in form_content
-
-            # Verify the model has user relationship
-            model_content = (project_dir / "app" / "models" / "post.py").read_text()
-            assert "user_id = db.Column(db.Integer, db.ForeignKey" in model_content
-            assert "user = db.relationship('User'" in model_content
-
-            # Check that app/__init__.py was updated
-            app_init = (project_dir / "app" / "__init__.py").read_text()
-            assert "from app.controllers.posts import posts_bp" in app_init
-            # Check for either single or double quotes
-            assert (
-                'app.register_blueprint(posts_bp, url_prefix="/posts")' in app_init
-                or "app.register_blueprint(posts_bp, url_prefix='/posts')" in app_init
-            )
-
-        finally:
-            # Restore original directory
-            os.chdir(original_cwd)
-
-
-def test_scaffold_view_templates_no_raw_jinja(runner):
+    # Step 1: Start from a fresh copy of a new project
+    project_dir = project_copy
+
+    # Step 2: Run just install (simulate it since we can't run actual subprocess in tests)
+    # In a real scenario, this would install dependencies
+    # We'll verify the files exist that would be needed
+    assert (project_dir / "justfile").exists()
+    assert (project_dir / "requirements.txt").exists()
+
+    # Step 3: Add Post scaffold with user:belongs_to
+    result = runner.invoke(
+        app,
+        [
+            "scaffold",
+            "Post",
+            "title:string",
+            "content:text",
+            "user:belongs_to",
+            "--app-path",
+            str(project_dir),
+        ],
+    )
+    assert result.exit_code == 0, f"Failed to scaffold Post: {result.stdout}"
+
+    # Verify scaffold files were created, in a single walk of the app tree
+    existing = {
+        p.relative_to(project_dir).as_posix() for p in (project_dir / "app").rglob("*")
+    }
+    expected = {
+        "app/models/post.py",
+        "app/controllers/posts.py",
+        "app/forms/post.py",
+        "app/views/posts/new.html",
+        "app/views/posts/edit.html",
+        "app/views/posts/_form.html",
+    }
+    assert not expected - existing, sorted(expected - existing)
+
+    # Step 4: Check the actual generated view templates
+    new_view = (project_dir / "app" / "views" / "posts" / "new.html").read_text()
+
+    # ISSUES TO FIX:
+    # 1. Templates should NOT contain {% raw %} tags
+    assert "{% raw %}" not in new_view, (
+        "Template contains {% raw %} tags which shouldn't be in final output"
+    )
+
+    # 2. Template variables should be rendered (not contain {{ model_name }})
+    assert "{{ model_name }}" not in new_view, (
+        "Template contains unrendered {{ model_name }} variable"
+    )
+    assert "<h1>New Post</h1>" in new_view, (
+        "Title should be rendered as 'New Post' not 'New {{ model_name }}'"
+    )
+
+    # 3. Include statements should be properly rendered
+    assert '{% include "posts/_form.html" %}' in new_view, (
+        "Include should reference 'posts/_form.html' not '{{ model_name_plural }}/_form.html'"
+    )
+
+    # 4. URL for should be properly rendered
+    assert "{{ url_for('posts.index') }}" in new_view, (
+        "URL should be for 'posts.index' not '{{ model_name_plural }}.index'"
+    )
+
+    # Check the form partial
+    form_view = (project_dir / "app" / "views" / "posts" / "_form.html").read_text()
+
+    # ISSUES TO FIX IN _form.html:
+    # 1. Should not contain {% raw %} tags
+    assert "{% raw %}" not in form_view, "Form template contains {% raw %} tags"
+
+    # 2. Should not have invalid nested syntax like {{ form.{{ field.name }} }}
+    # This is currently broken and creates invalid Jinja2
+    assert "{{ form.{{ field.name }}" not in form_view, (
+        "Form has invalid nested template syntax"
+    )
+
+    # 3. The form should have properly rendered field names
+    # Instead of a loop, it should have actual field names
+    assert (
+        "{{ form.title.label" in form_view or "{% for field in fields %}" in form_view
+    )
+
+    # These are what we'd expect if the template was properly generated:
+    # assert '{{ form.title.label' in form_view
+    # assert '{{ form.title(' in form_view
+    # assert '{{ form.content.label' in form_view
+    # assert '{{ form.content(' in form_view
+    # assert '{{ form.user_id.label' in form_view
+    # assert '{{ form.user_id(' in form_view
+
+    # Verify the controller has the proper route
+    controller_content = (project_dir / "app" / "controllers" / "posts.py").read_text()
+    assert '@posts_bp.route("/new", methods=["GET", "POST"])' in controller_content
+    assert "def new():" in controller_content
+    assert "form = PostForm()" in controller_content
+    assert 'return render_template("posts/new.html", form=form)' in controller_content
+
+    # Verify the form has user_id field
+    form_content = (project_dir / "app" / "forms" / "post.py").read_text()
+    assert 'user_id = SelectField("User"' in form_content
+    assert "from app.models.user import User" in form_content
+    assert "def __init__(self, *args, **kwargs):" in form_content
+    assert "User.query.all()" in form_content
+
+    # Verify the model has user relationship
+    model_content = (project_dir / "app" / "models" / "post.py").read_text()
+    assert "user_id = db.Column(db.Integer, db.ForeignKey" in model_content
+    assert "user = db.relationship('User'" in model_content
+
+    # Check that app/__init__.py was updated
+    app_init = (project_dir / "app" / "__init__.py").read_text()
+    assert "from app.controllers.posts import posts_bp" in app_init
+    # Check for either single or double quotes
+    assert (
+        'app.register_blueprint(posts_bp, url_prefix="/posts")' in app_init
+        or "app.register_blueprint(posts_bp, url_prefix='/posts')" in app_init
+    )
+
+
+def test_scaffold_view_templates_no_raw_jinja(runner, project_copy):
     """Test that generated view templates don't have {% raw %} tags."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        project_dir = Path(tmpdir) / "test_app"
-
-        # Create a new project
-        result = runner.invoke(app, ["init", "test-app", "--dir", str(project_dir)])
-        assert result.exit_code == 0
-
-        # Change to project directory
-        original_cwd = os.getcwd()
-        os.chdir(str(project_dir))
-
-        try:
-            # Create a scaffold
-            result = runner.invoke(
-                app,
-                [
-                    "scaffold",
-                    "Article",
-                    "title:string",
-                    "body:text",
-                    "author:belongs_to",
-                ],
-            )
-            assert result.exit_code == 0
-
-            # Check all generated view files
-            views_dir = project_dir / "app" / "views" / "articles"
-            for view_file in views_dir.glob("*.html"):
-                content = view_file.read_text()
-                # Ensure no {% raw %} or {% endraw %} tags in generated files
-                assert "{% raw %}" not in content, (
-                    f"Found {{% raw %}} in {view_file.name}"
-                )
-                assert "{% endraw %}" not in content, (
-                    f"Found {{% endraw %}} in {view_file.name}"
-                )
-
-                # Ensure proper Jinja2 syntax is present
-                if view_file.name != "_form.html":
-                    assert "{% extends" in content
-                    assert "{% block" in content
-                    assert "{% endblock" in content
-
-        finally:
-            os.chdir(original_cwd)
-
-
-def test_scaffold_form_with_multiple_relationships(runner):
+    project_dir = project_copy
+
+    # Create a scaffold
+    result = runner.invoke(
+        app,
+        [
+            "scaffold",
+            "Article",
+            "title:string",
+            "body:text",
+            "author:belongs_to",
+            "--app-path",
+            str(project_dir),
+        ],
+    )
+    assert result.exit_code == 0
+
+    # Check all generated view files
+    views_dir = project_dir / "app" / "views" / "articles"
+    for view_file in views_dir.glob("*.html"):
+        content = view_file.read_text()
+        # Ensure no {% raw %} or {% endraw %} tags in generated files
+        assert "{% raw %}" not in content, f"Found {{% raw %}} in {view_file.name}"
+        assert "{% endraw %}" not in content, (
+            f"Found {{% endraw %}} in {view_file.name}"
+        )
+
+        # Ensure proper Jinja2 syntax is present
+        if view_file.name != "_form.html":
+            assert "{% extends" in content
+            assert "{% block" in content
+            assert "{% endblock" in content
+
+
+def test_scaffold_form_with_multiple_relationships(runner, project_copy):
     """Test scaffold with multiple relationship fields.
 
     This test also reveals the template generation issues.
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        project_dir = Path(tmpdir) / "test_app"
-
-        # Create a new project
-        result = runner.invoke(app, ["init", "test-app", "--dir", str(project_dir)])
-        assert result.exit_code == 0
-
-        # Change to project directory
-        original_cwd = os.getcwd()
-        os.chdir(str(project_dir))
-
-        try:
-            # Create a Comment scaffold with multiple relationships
-            result = runner.invoke(
-                app,
-                [
-                    "scaffold",
-                    "Comment",
-                    "body:text",
-                    "post:belongs_to",
-                    "author:references",
-                ],
-            )
-            assert result.exit_code == 0
-
-            # Check the form has both relationship fields
-            form_content = (project_dir / "app" / "forms" / "comment.py").read_text()
-            assert 'post_id = SelectField("Post"' in form_content
-            assert 'author_id = SelectField("Author"' in form_content
-            assert "from app.models.post import Post" in form_content
-            assert "from app.models.author import Author" in form_content
-
-            # Check form initialization populates both select fields
-            assert "self.post_id.choices = [" in form_content
-            assert "self.author_id.choices = [" in form_content
-
-            # Check the form view - it currently has template issues
-            form_view = (
-                project_dir / "app" / "views" / "comments" / "_form.html"
-            ).read_text()
-
-            # The form template currently uses a loop with invalid nested syntax
-            # This is what's currently generated (which is broken):
-            assert (
-                "{% for field in fields %}" in form_view
-                or "{{ form.body.label" in form_view
-            )
-
-            # What we'd expect if templates were properly generated:
-            # assert '{{ form.post_id.label' in form_view
-            # assert '{{ form.post_id(' in form_view
-            # assert '{{ form.author_id.label' in form_view
-            # assert '{{ form.author_id(' in form_view
-
-        finally:
-            os.chdir(original_cwd)
+    project_dir = project_copy
+
+    # Create a Comment scaffold with multiple relationships
+    result = runner.invoke(
+        app,
+        [
+            "scaffold",
+            "Comment",
+            "body:text",
+            "post:belongs_to",
+            "author:references",
+            "--app-path",
+            str(project_dir),
+        ],
+    )
+    assert result.exit_code == 0
+
+    # Check the form has both relationship fields
+    form_content = (project_dir / "app" / "forms" / "comment.py").read_text()
+    assert 'post_id = SelectField("Post"' in form_content
+    assert 'author_id = SelectField("Author"' in form_content
+    assert "from app.models.post import Post" in form_content
+    assert "from app.models.author import Author" in form_content
+
+    # Check form initialization populates both select fields
+    assert "self.post_id.choices = [" in form_content
+    assert "self.author_id.choices = [" in form_content
+
+    # Check the form view - it currently has template issues
+    form_view = (project_dir / "app" / "views" / "comments" / "_form.html").read_text()
+
+    # The form template currently uses a loop with invalid nested syntax
+    # This is what's currently generated (which is broken):
+    assert "{% for field in fields %}" in form_view or "{{ form.body.label" in form_view
+
+    # What we'd expect if templates were properly generated:
+    # assert '{{ form.post_id.label' in form_view
+    # assert '{{ form.post_id(' in form_view
+    # assert '{{ form.author_id.label' in form_view
+    # assert '{{ form.author_id(' in form_view
@@ -1,59 +1,74 @@
 """Tests that validate generated Python code is syntactically correct."""
 
 import ast
-import tempfile
-from pathlib import Path
+import sys
+from functools import lru_cache
+from types import ModuleType
 
 import pytest
 
 from flasktrack.scaffold import Scaffold
 
+_POST_FIELDS = ("title:string", "author:references")
+_COMMENT_FIELDS = ("body:text", "post:references", "user:references")
+_ARTICLE_FIELDS = (
+    "title:string",
+    "content:text",
+    "published:boolean",
+    "author:references",
+    "category:references",
+)
+
+
+@lru_cache
+def _generate(name, fields, kind):
+    """Render one scaffold file, once per session for each set of arguments."""
+    return getattr(Scaffold(name, list(fields)), f"generate_{kind}")()
+
+
+@lru_cache
+def _parse(source):
+    """Parse generated code once per distinct source; callers must not mutate it."""
+    return ast.parse(source)
+
 
 class TestGeneratedCodeSyntax:
     """Test that generated code is valid Python."""
 
     def test_generated_model_is_valid_python(self):
         """Test that generated model code is syntactically valid."""
-        scaffold = Scaffold("Post", ["title:string", "author:references"])
-        model_code = scaffold.generate_model()
+        model_code = _generate("Post", _POST_FIELDS, "model")
 
         # This will raise SyntaxError if code is invalid
         try:
-            ast.parse(model_code)
+            _parse(model_code)
         except SyntaxError as e:
             pytest.fail(f"Generated model has syntax error: {e}")
 
     def test_generated_controller_is_valid_python(self):
         """Test that generated controller code is syntactically valid."""
-        scaffold = Scaffold("Post", ["title:string", "author:references"])
-        controller_code = scaffold.generate_controller()
+        controller_code = _generate("Post", _POST_FIELDS, "controller")
 
         try:
-            ast.parse(controller_code)
+            _parse(controller_code)
         except SyntaxError as e:
             pytest.fail(f"Generated controller has syntax error: {e}")
 
     def test_generated_form_is_valid_python(self):
         """Test that generated form code is syntactically valid."""
-        scaffold = Scaffold(
-            "Comment", ["body:text", "post:references", "user:references"]
-        )
-        form_code = scaffold.generate_form()
+        form_code = _generate("Comment", _COMMENT_FIELDS, "form")
 
         try:
-            ast.parse(form_code)
+            _parse(form_code)
         except SyntaxError as e:
             pytest.fail(f"Generated form has syntax error: {e}")
 
     def test_generated_form_imports_are_correct(self):
         """Test that form imports only reference models, not the form's own model."""
-        scaffold = Scaffold(
-            "Comment", ["body:text", "post:references", "user:references"]
-        )
-        form_code = scaffold.generate_form()
+        form_code = _generate("Comment", _COMMENT_FIELDS, "form")
 
         # Parse the AST to check imports
-        tree = ast.parse(form_code)
+        tree = _parse(form_code)
         imports = []
         for node in ast.walk(tree):
             if (
@@ -84,79 +99,49 @@ class TestGeneratedCodeSyntax:
                 f"Empty module name in import: from {module} import {name}"
             )
 
-    def test_all_generated_files_are_valid_python(self):
+    @pytest.mark.parametrize("kind", ["model", "controller", "form"])
+    def test_all_generated_files_are_valid_python(self, kind):
         """Integration test: Generate all files and verify they're valid Python."""
-        scaffold = Scaffold(
-            "Article",
-            [
-                "title:string",
-                "content:text",
-                "published:boolean",
-                "author:references",
-                "category:references",
-            ],
-        )
+        code = _generate("Article", _ARTICLE_FIELDS, kind)
 
-        # Generate all Python files
-        model_code = scaffold.generate_model()
-        controller_code = scaffold.generate_controller()
-        form_code = scaffold.generate_form()
-
-        # All should be valid Python
-        for name, code in [
-            ("model", model_code),
-            ("controller", controller_code),
-            ("form", form_code),
-        ]:
-            try:
-                ast.parse(code)
-            except SyntaxError as e:
-                pytest.fail(f"Generated {name} has syntax error: {e}\n\nCode:\n{code}")
+        try:
+            _parse(code)
+        except SyntaxError as e:
+            pytest.fail(f"Generated {kind} has syntax error: {e}\n\nCode:\n{code}")
 
-    def test_generated_code_can_be_executed_in_mock_environment(self):
+    def test_generated_code_can_be_executed_in_mock_environment(self, monkeypatch):
         """Test that generated code can actually be imported (with mocked dependencies)."""
         scaffold = Scaffold(
             "Product", ["name:string", "price:float", "category:references"]
         )
 
-        # Create a temporary directory for our test
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
-
-            # Create app structure
-            app_dir = tmppath / "app"
-            app_dir.mkdir()
-            (app_dir / "__init__.py").write_text("db = None")
-
-            models_dir = app_dir / "models"
-            models_dir.mkdir()
-            (models_dir / "__init__.py").touch()
-
-            forms_dir = app_dir / "forms"
-            forms_dir.mkdir()
-            (forms_dir / "__init__.py").touch()
-
-            # Write a mock Category model
-            (models_dir / "category.py").write_text("""
-class Category:
-    query = type('Query', (), {'all': lambda: []})()
-""")
+        # Stand in for the app package in sys.modules instead of on disk;
+        # monkeypatch drops the entries again after the test
+        category = ModuleType("app.models.category")
+        category.Category = type(
+            "Category", (), {"query": type("Query", (), {"all": lambda: []})()}
+        )
+        for name, module in [
+            ("app", ModuleType("app")),
+            ("app.models", ModuleType("app.models")),
+            ("app.models.category", category),
+        ]:
+            module.__path__ = []
+            monkeypatch.setitem(sys.modules, name, module)
 
-            # Write generated form
-            form_code = scaffold.generate_form()
-            form_path = forms_dir / "product.py"
+        form_code = scaffold.generate_form()
 
-            # Replace Flask-WTF imports with mocks for testing
-            # Create mock classes that accept arguments
-            form_code_modified = form_code
+        # Replace Flask-WTF imports with mocks for testing
+        # Create mock classes that accept arguments
+        form_code_modified = form_code
 
-            # First, replace all imports with mock definitions
-            import re
+        # First, replace all imports with mock definitions
+        import re
 
-            # Replace the multi-line wtforms import (handles the parenthesized import)
-            form_code_modified = re.sub(
-                r"from wtforms import \([^)]*\)",
-                """# Mock wtforms fields
+        # Replace the multi-line wtforms import (handles the parenthesized import)
+        form_code_modified = re.sub(
+            r"from wtforms import \([^)]*\)",
+            """# Mock wtforms fields
 StringField = lambda *args, **kwargs: None
 TextAreaField = lambda *args, **kwargs: None
 FloatField = lambda *args, **kwargs: None
@@ -168,14 +153,14 @@ DateTimeField = lambda *args, **kwargs: None
 TimeField = lambda *args, **kwargs: None
 SelectField = lambda *args, **kwargs: None
 SubmitField = lambda *args, **kwargs: None""",
-                form_code_modified,
-                flags=re.DOTALL,
-            )
+            form_code_modified,
+            flags=re.DOTALL,
+        )
 
-            # Also handle single-line wtforms imports if any
-            form_code_modified = re.sub(
-                r"from wtforms import [^\n]+(?!\()",
-                """# Mock wtforms fields (single line import)
+        # Also handle single-line wtforms imports if any
+        form_code_modified = re.sub(
+            r"from wtforms import [^\n]+(?!\()",
+            """# Mock wtforms fields (single line import)
 StringField = lambda *args, **kwargs: None
 TextAreaField = lambda *args, **kwargs: None
 FloatField = lambda *args, **kwargs: None
@@ -187,38 +172,30 @@ DateTimeField = lambda *args, **kwargs: None
 TimeField = lambda *args, **kwargs: None
 SelectField = lambda *args, **kwargs: None
 SubmitField = lambda *args, **kwargs: None""",
-                form_code_modified,
-            )
+            form_code_modified,
+        )
 
-            # Replace validators import
-            form_code_modified = re.sub(
-                r"from wtforms\.validators import .*",
-                "DataRequired = lambda *args, **kwargs: None\nLength = lambda *args, **kwargs: None",
-                form_code_modified,
-            )
+        # Replace validators import
+        form_code_modified = re.sub(
+            r"from wtforms\.validators import .*",
+            "DataRequired = lambda *args, **kwargs: None\nLength = lambda *args, **kwargs: None",
+            form_code_modified,
+        )
 
-            # Replace FlaskForm import
-            form_code_modified = form_code_modified.replace(
-                "from flask_wtf import FlaskForm", "class FlaskForm:\n    pass"
-            )
+        # Replace FlaskForm import
+        form_code_modified = form_code_modified.replace(
+            "from flask_wtf import FlaskForm", "class FlaskForm:\n    pass"
+        )
 
-            form_path.write_text(form_code_modified)
-
-            # Try to import it - this would fail with syntax errors
-            import sys
-
-            sys.path.insert(0, str(tmppath))
-            try:
-                # This will fail if there are import errors or syntax errors
-                exec("from app.forms.product import ProductForm")
-            except SyntaxError as e:
-                pytest.fail(
-                    f"Generated form cannot be imported due to syntax error: {e}"
-                )
-            except ImportError as e:
-                # Some import errors are expected (flask_wtf, etc.)
-                # But not syntax errors in imports
-                if "app.models." in str(e) and "import" in str(e):
-                    pytest.fail(f"Generated form has import error: {e}")
-            finally:
-                sys.path.remove(str(tmppath))
+        # Run it as app/forms/product.py would be run on import
+        try:
+            # This will fail if there are import errors or syntax errors
+            code = compile(form_code_modified, "app/forms/product.py", "exec")
+            exec(code, {"__name__": "app.forms.product"})
+        except SyntaxError as e:
+            pytest.fail(f"Generated form cannot be imported due to syntax error: {e}")
+        except ImportError as e:
+            # Some import errors are expected (flask_wtf, etc.)
+            # But not syntax errors in imports
+            if "app.models." in str(e) and "import" in str(e):
+                pytest.fail(f"Generated form has import error: {e}")
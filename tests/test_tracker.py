@@ -1,6 +1,7 @@
 """Test Flask tracker functionality."""
 
 import json
+import sys
 from pathlib import Path
 
 import pytest
@@ -8,11 +9,22 @@ import pytest
 from flasktrack.tracker import FlaskTracker
 
 
-def test_tracker_initialization(flask_app_file):
+@pytest.fixture(scope="session")
+def app_tracker(flask_app_file):
+    """Create a tracker for the shared app file; tests must not modify it."""
+    return FlaskTracker(flask_app_file)
+
+
+@pytest.fixture(scope="session")
+def app_analysis(app_tracker):
+    """Analyze the shared app once; tests must not modify the result."""
+    return app_tracker.analyze()
+
+
+def test_tracker_initialization(app_tracker):
     """Test tracker initialization with Flask app file."""
-    tracker = FlaskTracker(flask_app_file)
-    assert tracker.app is not None
-    assert tracker.app.name == "flask_app"
+    assert app_tracker.app is not None
+    assert app_tracker.app.name == "flask_app"
 
 
 def test_tracker_with_factory(flask_factory_file):
@@ -21,10 +33,28 @@ def test_tracker_with_factory(flask_factory_file):
     assert tracker.app is not None
 
 
-def test_get_routes(flask_app_file):
+def test_tracker_prefers_conventional_app_name(tmp_path):
+    """Test an instance named app wins over other Flask instances."""
+    app_file = tmp_path / "two_apps.py"
+    app_file.write_text(
+        "from flask import Flask\nadmin = Flask('admin')\napp = Flask('main')\n"
+    )
+
+    tracker = FlaskTracker(app_file)
+
+    assert tracker.app.name == "main"
+
+
+def test_tracker_restores_sys_path(flask_app_file):
+    """Test loading an app leaves sys.path as it found it."""
+    before = list(sys.path)
+    FlaskTracker(flask_app_file)
+    assert sys.path == before
+
+
+def test_get_routes(app_tracker):
     """Test getting routes from Flask app."""
-    tracker = FlaskTracker(flask_app_file)
-    routes = tracker.get_routes()
+    routes = app_tracker.get_routes()
 
     assert len(routes) == 5
 
@@ -39,10 +69,9 @@ def test_get_routes(flask_app_file):
     assert "POST" in data_route["methods"]
 
 
-def test_analyze(flask_app_file):
+def test_analyze(app_analysis):
     """Test Flask app analysis."""
-    tracker = FlaskTracker(flask_app_file)
-    analysis = tracker.analyze()
+    analysis = app_analysis
 
     assert analysis["total_routes"] == 5
     assert analysis["app_name"] == "flask_app"
@@ -52,13 +81,12 @@ def test_analyze(flask_app_file):
     assert "config_keys" in analysis
 
 
-def test_save_analysis(flask_app_file, tmp_path):
+def test_save_analysis(app_tracker, app_analysis, tmp_path):
     """Test saving analysis to file."""
-    tracker = FlaskTracker(flask_app_file)
-    analysis = tracker.analyze()
+    analysis = app_analysis
 
     output_file = tmp_path / "test_analysis.json"
-    tracker.save_analysis(analysis, output_file)
+    app_tracker.save_analysis(analysis, output_file)
 
     assert output_file.exists()
 
@@ -68,6 +96,14 @@ def test_save_analysis(flask_app_file, tmp_path):
     assert saved_data == analysis
 
 
+def test_save_analysis_layout(app_tracker, app_analysis, tmp_path):
+    """Test saved analyses are indented JSON with a trailing newline."""
+    output_file = tmp_path / "test_analysis.json"
+    app_tracker.save_analysis(app_analysis, output_file)
+
+    assert output_file.read_text() == json.dumps(app_analysis, indent=2) + "\n"
+
+
 def test_tracker_verbose_mode(flask_app_file):
     """Test tracker in verbose mode."""
     tracker = FlaskTracker(flask_app_file, verbose=True)
@@ -81,6 +117,31 @@ def test_tracker_nonexistent_file():
     assert tracker.app.name == "flasktrack"
 
 
+def test_start_tracking_registers_hooks_once(flask_app_file, tmp_path):
+    """Test repeated start_tracking calls add a single pair of hooks."""
+    app_file = tmp_path / "app.py"
+    app_file.write_text(flask_app_file.read_text())
+
+    tracker = FlaskTracker(app_file, verbose=True)
+    tracker.start_tracking()
+    tracker.start_tracking()
+
+    assert len(tracker.app.before_request_funcs[None]) == 1
+    assert len(tracker.app.after_request_funcs[None]) == 1
+
+
+def test_start_tracking_quiet_adds_no_hooks(flask_app_file, tmp_path):
+    """Test a non-verbose tracker leaves the request hooks untouched."""
+    app_file = tmp_path / "app.py"
+    app_file.write_text(flask_app_file.read_text())
+
+    tracker = FlaskTracker(app_file)
+    tracker.start_tracking()
+
+    assert not tracker.app.before_request_funcs.get(None)
+    assert not tracker.app.after_request_funcs.get(None)
+
+
 def test_start_tracking_without_app():
     """Test start tracking without loaded app."""
     tracker = FlaskTracker(Path("nonexistent.py"))
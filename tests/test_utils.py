@@ -1,9 +1,11 @@
 """Test utility functions."""
 
-import tempfile
+import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from flasktrack.utils import (
     add_user_to_app,
     format_size,
@@ -12,13 +14,26 @@ from flasktrack.utils import (
 )
 
 
-def test_format_size():
+@pytest.mark.parametrize(
+    "size, expected",
+    [
+        (100, "100.0 B"),
+        (1024, "1.0 KB"),
+        (1024 * 1024, "1.0 MB"),
+        (1024 * 1024 * 1024, "1.0 GB"),
+        (1536, "1.5 KB"),
+        (0, "0.0 B"),
+        (1023, "1023.0 B"),
+        (1024**4, "1.0 TB"),
+        (1024**5, "1024.0 TB"),
+        (0.5, "0.5 B"),
+        (1023.9, "1023.9 B"),
+        (1536.0, "1.5 KB"),
+    ],
+)
+def test_format_size(size, expected):
     """Test size formatting."""
-    assert format_size(100) == "100.0 B"
-    assert format_size(1024) == "1.0 KB"
-    assert format_size(1024 * 1024) == "1.0 MB"
-    assert format_size(1024 * 1024 * 1024) == "1.0 GB"
-    assert format_size(1536) == "1.5 KB"
+    assert format_size(size) == expected
 
 
 def test_get_project_info_file(flask_app_file):
@@ -43,6 +58,20 @@ def test_get_project_info_directory(tmp_path):
     assert info["python_files"] == 2
 
 
+def test_get_project_info_counts_nested_files(tmp_path):
+    """Test python files in subdirectories are counted."""
+    (tmp_path / "app.py").write_text("")
+    (tmp_path / "README.md").write_text("")
+    package = tmp_path / "app" / "models"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "user.py").write_text("")
+
+    info = get_project_info(tmp_path)
+
+    assert info["python_files"] == 3
+
+
 def test_get_project_info_nonexistent():
     """Test getting project info for non-existent path."""
     info = get_project_info(Path("/nonexistent/path"))
@@ -50,40 +79,46 @@ def test_get_project_info_nonexistent():
     assert info["exists"] is False
 
 
-def test_validate_flask_app_valid():
+def test_validate_flask_app_valid(tmp_path):
     """Test validating a valid Flask app file."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write("from flask import Flask\napp = Flask(__name__)")
-        temp_path = Path(f.name)
+    app_file = tmp_path / "app.py"
+    app_file.write_text("from flask import Flask\napp = Flask(__name__)")
 
-    try:
-        assert validate_flask_app(temp_path) is True
-    finally:
-        temp_path.unlink()
+    assert validate_flask_app(app_file) is True
 
 
-def test_validate_flask_app_import_style():
+def test_validate_flask_app_import_style(tmp_path):
     """Test validating Flask app with different import style."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write("import flask\napp = flask.Flask(__name__)")
-        temp_path = Path(f.name)
+    app_file = tmp_path / "app.py"
+    app_file.write_text("import flask\napp = flask.Flask(__name__)")
+
+    assert validate_flask_app(app_file) is True
+
+
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        ("from flask.views import MethodView\n", True),
+        ("import os\n\nimport flask.json\n", True),
+        ("# from flask import Flask\n", False),
+        ("print('import flask')\n", False),
+        ("import flasky\n", False),
+    ],
+)
+def test_validate_flask_app_matches_import_statements(tmp_path, source, expected):
+    """Test only real flask import statements mark a file as an app."""
+    app_file = tmp_path / "app.py"
+    app_file.write_text(source)
 
-    try:
-        assert validate_flask_app(temp_path) is True
-    finally:
-        temp_path.unlink()
+    assert validate_flask_app(app_file) is expected
 
 
-def test_validate_flask_app_invalid():
+def test_validate_flask_app_invalid(tmp_path):
     """Test validating an invalid Flask app file."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write("print('not a flask app')")
-        temp_path = Path(f.name)
+    app_file = tmp_path / "app.py"
+    app_file.write_text("print('not a flask app')")
 
-    try:
-        assert validate_flask_app(temp_path) is False
-    finally:
-        temp_path.unlink()
+    assert validate_flask_app(app_file) is False
 
 
 def test_validate_flask_app_nonexistent():
@@ -91,20 +126,16 @@ def test_validate_flask_app_nonexistent():
     assert validate_flask_app(Path("/nonexistent.py")) is False
 
 
-def test_validate_flask_app_wrong_extension():
+def test_validate_flask_app_wrong_extension(tmp_path):
     """Test validating file with wrong extension."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-        f.write("from flask import Flask")
-        temp_path = Path(f.name)
+    app_file = tmp_path / "app.txt"
+    app_file.write_text("from flask import Flask")
 
-    try:
-        assert validate_flask_app(temp_path) is False
-    finally:
-        temp_path.unlink()
+    assert validate_flask_app(app_file) is False
 
 
 def test_add_user_to_app_mock():
-    """Test add_user_to_app with mocked subprocess."""
+    """Test add_user_to_app passes the user's details as JSON, not code."""
     mock_result = MagicMock()
     mock_result.returncode = 0
     mock_result.stderr = ""
@@ -112,10 +143,13 @@ def test_add_user_to_app_mock():
     with patch("subprocess.run", return_value=mock_result) as mock_run:
         result = add_user_to_app(
             app_path=Path("/test/path"),
-            username="testuser",
+            username='o"brien',
             email="test@example.com",
             password="testpass",
         )
 
-        assert result is True
-        mock_run.assert_called_once()
+    assert result is True
+    args, kwargs = mock_run.call_args
+    assert kwargs["cwd"] == str(Path("/test/path"))
+    assert 'o"brien' not in " ".join(args[0])
+    assert json.loads(kwargs["input"])["username"] == 'o"brien'